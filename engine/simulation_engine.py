@@ -44,6 +44,10 @@ class SimulationEngine:
         self.adaptive_selector = AdaptiveSelector()
         self.last_result: Optional[SchedulingResult] = None
         
+        # (workload analysis, wait divisors, recommendation) from the last
+        # get_adaptive_recommendation call
+        self._recommendation_cache: Optional[Tuple[object, Tuple[float, ...], Dict]] = None
+        
         # Resource management
         self.resource_manager = ResourceManager()
         self.rag = ResourceAllocationGraph()
@@ -254,13 +258,21 @@ class SimulationEngine:
         if not self.processes:
             return {'algorithm': 'None', 'justification': 'No processes'}
         
-        recommendation = self.adaptive_selector.select_scheduler(self.processes)
-        return {
-            'algorithm': recommendation.algorithm_name,
-            'justification': recommendation.justification,
-            'expected_wait': recommendation.expected_avg_wait,
-            'confidence': recommendation.confidence
-        }
+        # The recommendation depends only on the workload analysis and the
+        # learned wait divisors, so recompute it only when either changes
+        selector = self.adaptive_selector
+        analysis = selector.analyze_workload(self.processes)
+        divisors = tuple(selector.wait_divisors.values())
+        cache = self._recommendation_cache
+        if cache is None or cache[0] != analysis or cache[1] != divisors:
+            recommendation = selector.select_scheduler(self.processes)
+            cache = self._recommendation_cache = (analysis, divisors, {
+                'algorithm': recommendation.algorithm_name,
+                'justification': recommendation.justification,
+                'expected_wait': recommendation.expected_avg_wait,
+                'confidence': recommendation.confidence
+            })
+        return dict(cache[2])
     
     def compare_all_schedulers(self) -> List[Dict]:
         """Compare all scheduling algorithms."""
@@ -280,7 +292,8 @@ class SimulationEngine:
                 p.reset()
             
             scheduler = scheduler_class()
-            result = scheduler.schedule(self.processes.copy())
+            scheduler.logging_enabled = False  # only the metrics are reported
+            result = scheduler.schedule(self.processes)
             
             results.append({
                 'algorithm': name,
@@ -15,7 +15,25 @@ class ProcessState(Enum):
     TERMINATED = "TERMINATED"
 
 
-@dataclass
+# Rich colors and emojis used when rendering process states
+_STATE_COLOR = {
+    ProcessState.NEW: "cyan",
+    ProcessState.READY: "green",
+    ProcessState.RUNNING: "yellow",
+    ProcessState.BLOCKED: "red",
+    ProcessState.TERMINATED: "white"
+}
+
+_STATE_EMOJI = {
+    ProcessState.NEW: "🔵",
+    ProcessState.READY: "🟢",
+    ProcessState.RUNNING: "🟡",
+    ProcessState.BLOCKED: "🔴",
+    ProcessState.TERMINATED: "⚪"
+}
+
+
+@dataclass(slots=True)
 class Process:
     """Represents a process in the OS simulation."""
     pid: int
@@ -93,25 +111,11 @@ class Process:
     
     def get_state_color(self) -> str:
         """Get the Rich color for the current state."""
-        color_map = {
-            ProcessState.NEW: "cyan",
-            ProcessState.READY: "green",
-            ProcessState.RUNNING: "yellow",
-            ProcessState.BLOCKED: "red",
-            ProcessState.TERMINATED: "white"
-        }
-        return color_map.get(self.state, "white")
+        return _STATE_COLOR.get(self.state, "white")
     
     def get_state_emoji(self) -> str:
         """Get emoji for the current state."""
-        emoji_map = {
-            ProcessState.NEW: "🔵",
-            ProcessState.READY: "🟢",
-            ProcessState.RUNNING: "🟡",
-            ProcessState.BLOCKED: "🔴",
-            ProcessState.TERMINATED: "⚪"
-        }
-        return emoji_map.get(self.state, "⚪")
+        return _STATE_EMOJI.get(self.state, "⚪")
     
     def __repr__(self) -> str:
         return f"Process(pid={self.pid}, name={self.name}, state={self.state.value})"
@@ -2,7 +2,7 @@
 
 from enum import Enum
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from typing import Dict, Optional
 
 
 class ResourceType(Enum):
@@ -24,26 +24,27 @@ class Resource:
     # Runtime attributes
     available_instances: int = field(default=0, init=False)
     allocated_to: Dict[int, int] = field(default_factory=dict)  # pid -> count
-    waiting_queue: List[int] = field(default_factory=list)  # List of waiting PIDs
+    # Waiting PIDs in request order; a dict used as an ordered set, so
+    # membership tests and removal on allocate are O(1)
+    waiting_queue: Dict[int, None] = field(default_factory=dict)
     
     def __post_init__(self):
         """Initialize available instances after creation."""
         self.available_instances = self.total_instances
+        self.waiting_queue = dict.fromkeys(self.waiting_queue)
     
     def allocate(self, pid: int, count: int = 1) -> bool:
         """Allocate resource instances to a process.
         
         Returns True if allocation was successful, False otherwise.
         """
-        if count <= self.available_instances:
-            self.available_instances -= count
-            if pid in self.allocated_to:
-                self.allocated_to[pid] += count
-            else:
-                self.allocated_to[pid] = count
+        available = self.available_instances
+        if count <= available:
+            self.available_instances = available - count
+            allocated_to = self.allocated_to
+            allocated_to[pid] = allocated_to.get(pid, 0) + count
             # Remove from waiting queue if present
-            if pid in self.waiting_queue:
-                self.waiting_queue.remove(pid)
+            self.waiting_queue.pop(pid, None)
             return True
         return False
     
@@ -53,25 +54,24 @@ class Resource:
         If count is None, releases all instances held by the process.
         Returns the number of instances released.
         """
-        if pid not in self.allocated_to:
+        allocated_to = self.allocated_to
+        current = allocated_to.get(pid, 0)
+        if current == 0:
             return 0
         
-        if count is None:
-            count = self.allocated_to[pid]
+        if count is None or count >= current:
+            actual_release = current
+            del allocated_to[pid]
+        else:
+            actual_release = count
+            allocated_to[pid] = current - count
         
-        actual_release = min(count, self.allocated_to[pid])
-        self.allocated_to[pid] -= actual_release
         self.available_instances += actual_release
-        
-        if self.allocated_to[pid] == 0:
-            del self.allocated_to[pid]
-        
         return actual_release
     
     def request(self, pid: int) -> None:
         """Add a process to the waiting queue."""
-        if pid not in self.waiting_queue:
-            self.waiting_queue.append(pid)
+        self.waiting_queue.setdefault(pid)
     
     def get_allocated_count(self, pid: int) -> int:
         """Get the number of instances allocated to a process."""
@@ -2,6 +2,7 @@
 
 from typing import Dict, List, Tuple, Optional
 from dataclasses import dataclass
+from operator import le
 
 
 @dataclass
@@ -19,6 +20,41 @@ class AllocationRequest:
     resources: Dict[int, int]  # {rid: count}
 
 
+def safety_sequence(work: List[int], allocation: Dict[int, List[int]],
+                    need: Dict[int, List[int]]) -> List[int]:
+    """Run the safety algorithm over dense per-process rows.
+    
+    All rows share one column order (one column per resource).
+    
+    Args:
+        work: Available vector
+        allocation: Current allocation rows {pid: row}
+        need: Remaining need rows {pid: row}
+        
+    Returns:
+        PIDs in the order they can run to completion. Processes that can
+        never finish are left out.
+    """
+    pending = list(allocation)
+    sequence = []
+    
+    while pending:
+        blocked = []
+        for pid in pending:
+            if all(map(le, need[pid], work)):
+                # Process can complete, release its allocation
+                work = [w + a for w, a in zip(work, allocation[pid])]
+                sequence.append(pid)
+            else:
+                blocked.append(pid)
+        
+        if len(blocked) == len(pending):
+            break
+        pending = blocked
+    
+    return sequence
+
+
 class BankersAlgorithm:
     """Banker's Algorithm for deadlock prevention.
     
@@ -164,33 +200,15 @@ class BankersAlgorithm:
         Returns:
             SafetyCheckResult with is_safe, safe_sequence, and message
         """
-        work = self.available.copy()
-        finish = {pid: False for pid in self.allocation}
-        safe_sequence = []
-        
-        while True:
-            found = False
-            
-            for pid in self.allocation:
-                if not finish[pid]:
-                    # Check if need[pid] <= work
-                    can_finish = all(
-                        self.need.get(pid, {}).get(rid, 0) <= work.get(rid, 0)
-                        for rid in self.total
-                    )
-                    
-                    if can_finish:
-                        # Process can complete
-                        for rid in self.total:
-                            work[rid] += self.allocation.get(pid, {}).get(rid, 0)
-                        finish[pid] = True
-                        safe_sequence.append(pid)
-                        found = True
-            
-            if not found:
-                break
+        rids = list(self.total)
+        work = [self.available.get(rid, 0) for rid in rids]
+        allocation = {pid: [alloc.get(rid, 0) for rid in rids]
+                      for pid, alloc in self.allocation.items()}
+        need = {pid: [self.need.get(pid, {}).get(rid, 0) for rid in rids]
+                for pid in self.allocation}
         
-        is_safe = all(finish.values())
+        safe_sequence = safety_sequence(work, allocation, need)
+        is_safe = len(safe_sequence) == len(allocation)
         
         if is_safe:
             return SafetyCheckResult(
@@ -199,7 +217,8 @@ class BankersAlgorithm:
                 message=f"System is in SAFE state. Safe sequence: {safe_sequence}"
             )
         else:
-            unsafe_processes = [pid for pid, done in finish.items() if not done]
+            finished = set(safe_sequence)
+            unsafe_processes = [pid for pid in self.allocation if pid not in finished]
             return SafetyCheckResult(
                 is_safe=False,
                 safe_sequence=[],
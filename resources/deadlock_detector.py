@@ -2,7 +2,8 @@
 
 from typing import Dict, List, Set, Tuple, Optional
 from dataclasses import dataclass
-from .rag import ResourceAllocationGraph
+from .rag import ResourceAllocationGraph, node_entity_id
+from .bankers_algorithm import safety_sequence
 
 
 @dataclass
@@ -21,6 +22,86 @@ class DeadlockInfo:
                 f"Resources Involved: {self.resources}")
 
 
+def strongly_connected_components(graph: Dict[int, List[int]]) -> List[List[int]]:
+    """Find the strongly connected components of a wait-for graph.
+    
+    Iterative Tarjan's algorithm, so deep wait chains cannot hit the
+    recursion limit. Nodes that only appear as neighbors are included.
+    
+    Returns: list of components, each a list of process IDs
+    """
+    index: Dict[int, int] = {}
+    lowlink: Dict[int, int] = {}
+    on_stack: Set[int] = set()
+    stack: List[int] = []
+    components: List[List[int]] = []
+    counter = 0
+    
+    for root in graph:
+        if root in index:
+            continue
+        
+        index[root] = lowlink[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack.add(root)
+        work = [(root, iter(graph.get(root, ())))]
+        
+        while work:
+            node, neighbors = work[-1]
+            advanced = False
+            for neighbor in neighbors:
+                if neighbor not in index:
+                    index[neighbor] = lowlink[neighbor] = counter
+                    counter += 1
+                    stack.append(neighbor)
+                    on_stack.add(neighbor)
+                    work.append((neighbor, iter(graph.get(neighbor, ()))))
+                    advanced = True
+                    break
+                if neighbor in on_stack and index[neighbor] < lowlink[node]:
+                    lowlink[node] = index[neighbor]
+            if advanced:
+                continue
+            
+            work.pop()
+            if work:
+                parent = work[-1][0]
+                if lowlink[node] < lowlink[parent]:
+                    lowlink[parent] = lowlink[node]
+            
+            if lowlink[node] == index[node]:
+                component = []
+                while True:
+                    member = stack.pop()
+                    on_stack.discard(member)
+                    component.append(member)
+                    if member == node:
+                        break
+                components.append(component)
+    
+    return components
+
+
+def component_cycle(component: List[int], graph: Dict[int, List[int]]) -> List[int]:
+    """Find a cycle inside a strongly connected component of a wait-for graph.
+    
+    Every member waits on another member, so walking successors inside
+    the component must revisit a node; that loop is a cycle.
+    
+    Returns: cycle of process IDs with the first one repeated at the end
+    """
+    members = set(component)
+    seen: Dict[int, int] = {}
+    walk: List[int] = []
+    pid = component[0]
+    while pid not in seen:
+        seen[pid] = len(walk)
+        walk.append(pid)
+        pid = next(q for q in graph[pid] if q in members)
+    return walk[seen[pid]:] + [pid]
+
+
 class DeadlockDetector:
     """Deadlock detection using DFS-based cycle detection on RAG."""
     
@@ -28,10 +109,15 @@ class DeadlockDetector:
         self.rag = rag or ResourceAllocationGraph()
         self.deadlock_history: List[DeadlockInfo] = []
         self.current_time: int = 0
+        
+        # (rag, rag generation, process cycle or None) from the last detect()
+        self._cycle_cache: Optional[Tuple[ResourceAllocationGraph, int,
+                                          Optional[List[int]]]] = None
     
     def set_rag(self, rag: ResourceAllocationGraph) -> None:
         """Set the Resource Allocation Graph to monitor."""
         self.rag = rag
+        self._cycle_cache = None
     
     def detect(self) -> Optional[DeadlockInfo]:
         """Detect deadlock in the current RAG state.
@@ -39,43 +125,52 @@ class DeadlockDetector:
         Uses DFS to find cycles in the wait-for graph.
         Returns DeadlockInfo if deadlock is found, None otherwise.
         """
+        rag = self.rag
+        generation = rag.generation
+        cache = self._cycle_cache
+        if cache is None or cache[0] is not rag or cache[1] != generation:
+            cache = self._cycle_cache = (rag, generation, self._find_cycle())
+        
+        cycle = cache[2]
+        if cycle is None:
+            return None
+        return self._create_deadlock_info(cycle)
+    
+    def _find_cycle(self) -> Optional[List[int]]:
+        """Find one cycle of process IDs in the wait-for graph, if any."""
         # Build wait-for graph from RAG
         wait_for = self.rag.get_wait_for_graph()
         
         if not wait_for:
             return None
         
-        # DFS for cycle detection
+        # Iterative DFS for cycle detection (explicit stack, so long wait
+        # chains cannot exceed the recursion limit)
         visited: Set[int] = set()
-        rec_stack: Set[int] = set()
-        path: List[int] = []
         
-        def dfs(pid: int) -> Optional[List[int]]:
-            visited.add(pid)
-            rec_stack.add(pid)
-            path.append(pid)
+        for root in wait_for.keys():
+            if root in visited:
+                continue
             
-            for neighbor in wait_for.get(pid, []):
-                if neighbor not in visited:
-                    cycle = dfs(neighbor)
-                    if cycle:
-                        return cycle
-                elif neighbor in rec_stack:
-                    # Found cycle - extract it
-                    cycle_start = path.index(neighbor)
-                    return path[cycle_start:] + [neighbor]
+            visited.add(root)
+            path: List[int] = [root]
+            on_path: Dict[int, int] = {root: 0}  # pid -> index in path
+            stack = [iter(wait_for.get(root, ()))]
             
-            path.pop()
-            rec_stack.remove(pid)
-            return None
-        
-        # Check all processes for cycles
-        for pid in wait_for.keys():
-            if pid not in visited:
-                path.clear()
-                cycle = dfs(pid)
-                if cycle:
-                    return self._create_deadlock_info(cycle)
+            while stack:
+                for neighbor in stack[-1]:
+                    if neighbor not in visited:
+                        visited.add(neighbor)
+                        on_path[neighbor] = len(path)
+                        path.append(neighbor)
+                        stack.append(iter(wait_for.get(neighbor, ())))
+                        break
+                    if neighbor in on_path:
+                        # Found cycle - extract it
+                        return path[on_path[neighbor]:] + [neighbor]
+                else:
+                    stack.pop()
+                    del on_path[path.pop()]
         
         return None
     
@@ -118,6 +213,25 @@ class DeadlockDetector:
         
         return deadlocks
     
+    def detect_all_sccs(self) -> List[DeadlockInfo]:
+        """Detect every independent deadlock in the current RAG state.
+        
+        Each strongly connected component of the wait-for graph with more
+        than one process is a separate deadlock. Its DeadlockInfo describes
+        one cycle through the component (processes and resources on that
+        cycle); other cycles in the same component are reported by later
+        calls if they survive breaking this one.
+        """
+        wait_for = self.rag.get_wait_for_graph()
+        
+        deadlocks = []
+        for component in strongly_connected_components(wait_for):
+            if len(component) < 2:
+                continue
+            deadlocks.append(self._create_deadlock_info(component_cycle(component, wait_for)))
+        
+        return deadlocks
+    
     def _create_deadlock_info(self, process_cycle: List[int]) -> DeadlockInfo:
         """Create a DeadlockInfo object from a cycle of process IDs."""
         # Build the full cycle chain including resources
@@ -131,17 +245,12 @@ class DeadlockDetector:
             chain.append(f"P{pid}")
             
             # Find the resource that pid is waiting for from next_pid
-            for edge in self.rag.edges:
-                if edge.edge_type == 'request' and edge.from_node == f"P{pid}":
-                    rid = int(edge.to_node[1:])
-                    # Check if next_pid holds this resource
-                    for assign in self.rag.edges:
-                        if (assign.edge_type == 'assignment' and 
-                            assign.from_node == f"R{rid}" and
-                            assign.to_node == f"P{next_pid}"):
-                            chain.append(f"R{rid}")
-                            resources.add(rid)
-                            break
+            for edge in self.rag.get_request_edges(pid):
+                rid = node_entity_id(edge.to_node)
+                # Check if next_pid holds this resource
+                if self.rag.get_assignment_edge(rid, next_pid) is not None:
+                    chain.append(f"R{rid}")
+                    resources.add(rid)
         
         # Complete the cycle
         if process_cycle:
@@ -176,46 +285,19 @@ class DeadlockDetector:
         if not allocation:
             return True, []
         
-        processes = list(allocation.keys())
         resources = list(available.keys())
-        n = len(processes)
-        
-        # Calculate need matrix
-        need = {}
-        for pid in processes:
-            need[pid] = {}
-            for rid in resources:
-                alloc = allocation.get(pid, {}).get(rid, 0)
-                max_n = max_need.get(pid, {}).get(rid, 0)
-                need[pid][rid] = max_n - alloc
-        
-        # Work = Available
-        work = available.copy()
-        finish = {pid: False for pid in processes}
-        safe_sequence = []
-        
-        while True:
-            found = False
-            for pid in processes:
-                if not finish[pid]:
-                    # Check if need[pid] <= work
-                    can_satisfy = all(
-                        need[pid].get(rid, 0) <= work.get(rid, 0)
-                        for rid in resources
-                    )
-                    
-                    if can_satisfy:
-                        # Process can complete, release resources
-                        for rid in resources:
-                            work[rid] = work.get(rid, 0) + allocation.get(pid, {}).get(rid, 0)
-                        finish[pid] = True
-                        safe_sequence.append(pid)
-                        found = True
-            
-            if not found:
-                break
         
-        is_safe = all(finish.values())
+        # Densify into rows sharing the resource column order
+        work = [available[rid] for rid in resources]
+        alloc_rows = {pid: [alloc.get(rid, 0) for rid in resources]
+                      for pid, alloc in allocation.items()}
+        need_rows = {}
+        for pid, row in alloc_rows.items():
+            max_n = max_need.get(pid, {})
+            need_rows[pid] = [max_n.get(rid, 0) - a for rid, a in zip(resources, row)]
+        
+        safe_sequence = safety_sequence(work, alloc_rows, need_rows)
+        is_safe = len(safe_sequence) == len(alloc_rows)
         return is_safe, safe_sequence if is_safe else []
     
     def set_time(self, time: int) -> None:
@@ -230,3 +312,4 @@ class DeadlockDetector:
         """Reset the detector state."""
         self.deadlock_history.clear()
         self.current_time = 0
+        self._cycle_cache = None
@@ -15,7 +15,7 @@ class ResolutionMethod(Enum):
     RESOURCE_PREEMPTION = "resource_preemption"
 
 
-@dataclass
+@dataclass(slots=True)
 class ResolutionResult:
     """Result of a deadlock resolution attempt."""
     method: ResolutionMethod
@@ -40,6 +40,7 @@ class DeadlockResolver:
         self.resolution_history: List[ResolutionResult] = []
         self.process_priorities: Dict[int, int] = {}  # Lower = more important
         self.process_rollback_costs: Dict[int, int] = {}  # Cost of rolling back
+        self._ordering: Dict[int, int] = {}  # Last apply_resource_ordering result
     
     def set_process_priority(self, pid: int, priority: int) -> None:
         """Set the priority of a process for victim selection."""
@@ -106,6 +107,14 @@ class DeadlockResolver:
         
         # Find minimum resources to preempt
         resources_to_preempt = self._find_minimum_preemption(victim, deadlock)
+        if not resources_to_preempt:
+            return ResolutionResult(
+                method=ResolutionMethod.RESOURCE_PREEMPTION,
+                victim_pid=victim,
+                resources_released={},
+                success=False,
+                message=f"P{victim} holds no deadlocked resource to preempt"
+            )
         
         # Perform preemption
         for rid, count in resources_to_preempt.items():
@@ -125,27 +134,14 @@ class DeadlockResolver:
     
     def _select_victim(self, processes: List[int]) -> int:
         """Select a victim process for termination."""
-        # Score each process (higher = better victim candidate)
-        scores = {}
-        
-        for pid in processes:
-            score = 0
-            
-            # Priority (lower priority = higher score)
+        # Score each process (higher = better victim candidate):
+        # lower priority first, then more resources held, then higher PID
+        def score(pid: int) -> int:
             priority = self.process_priorities.get(pid, 5)
-            score += (10 - priority) * 100
-            
-            # Resources held (more resources = higher score)
             resources_held = len(self.rag.get_resources_held_by_process(pid))
-            score += resources_held * 10
-            
-            # Lower PID as tie-breaker (higher PID = higher score)
-            score += pid
-            
-            scores[pid] = score
+            return (10 - priority) * 100 + resources_held * 10 + pid
         
-        # Select process with highest score
-        return max(processes, key=lambda p: scores.get(p, 0))
+        return max(processes, key=score)
     
     def _select_victim_for_preemption(self, processes: List[int]) -> int:
         """Select a victim for resource preemption based on rollback cost."""
@@ -154,32 +150,30 @@ class DeadlockResolver:
     
     def _release_process_resources(self, pid: int) -> Dict[int, int]:
         """Release all resources held by a process."""
-        released = {}
-        
-        for rid, resource in self.resource_manager.resources.items():
-            count = resource.release(pid)
-            if count > 0:
-                released[rid] = count
-        
-        return released
+        # Through the manager, so its per-process holdings index stays exact
+        return self.resource_manager.release_all(pid)
     
     def _find_minimum_preemption(self, victim_pid: int, 
                                    deadlock: DeadlockInfo) -> Dict[int, int]:
-        """Find minimum resources to preempt to break deadlock."""
-        resources_to_preempt = {}
+        """Find minimum resources to preempt to break deadlock.
+        
+        One deadlocked resource taken from the victim is usually enough to
+        break the cycle, so prefer the one with the fewest instances held.
+        """
+        best_rid, best_count = None, 0
         
-        # For each resource involved in deadlock that victim holds
         for rid in deadlock.resources:
-            assignment_edges = [e for e in self.rag.edges 
-                              if e.from_node == f"R{rid}" and 
-                              e.to_node == f"P{victim_pid}" and
-                              e.edge_type == 'assignment']
-            
-            if assignment_edges:
-                resources_to_preempt[rid] = assignment_edges[0].count
-                break  # Preempt minimum (one resource may be enough)
+            edge = self.rag.get_assignment_edge(rid, victim_pid)
+            if edge is None:
+                continue
+            if edge.count <= 1:
+                return {rid: edge.count}  # Cannot preempt less than this
+            if best_rid is None or edge.count < best_count:
+                best_rid, best_count = rid, edge.count
         
-        return resources_to_preempt
+        if best_rid is None:
+            return {}
+        return {best_rid: best_count}
     
     def resolve_automatically(self, method: ResolutionMethod = None) -> Optional[ResolutionResult]:
         """Detect and automatically resolve any deadlock.
@@ -190,6 +184,9 @@ class DeadlockResolver:
         Returns:
             ResolutionResult if deadlock was found and resolved, None otherwise
         """
+        if not self._deadlock_possible():
+            return None
+        
         deadlock = self.detector.detect()
         
         if deadlock is None:
@@ -200,10 +197,20 @@ class DeadlockResolver:
         else:
             return self.resolve_by_preemption(deadlock)
     
+    def _deadlock_possible(self) -> bool:
+        """Cheap necessary condition for a deadlock.
+        
+        Checked on the RAG that detection runs on: a wait-for cycle needs
+        some request edge to a resource with holders, so with none
+        detection can be skipped.
+        """
+        return self.rag.has_blocked_request()
+    
     def resolve_all(self, method: ResolutionMethod = None) -> List[ResolutionResult]:
         """Resolve all deadlocks in the system.
         
-        Continues resolving until no deadlocks remain.
+        Continues resolving until no deadlocks remain, or stops at the
+        first resolution that fails to free anything.
         """
         results = []
         max_iterations = self.MAX_RESOLUTION_ITERATIONS
@@ -213,6 +220,8 @@ class DeadlockResolver:
             if result is None:
                 break
             results.append(result)
+            if not result.success:
+                break  # Nothing was freed; retrying cannot help
         
         return results
     
@@ -221,16 +230,25 @@ class DeadlockResolver:
         
         Returns a mapping of resource_id to order number.
         Processes should always request resources in increasing order.
+        The ordering is also kept as the default for check_ordering_violation.
         """
-        return {rid: i for i, rid in enumerate(sorted(resources))}
+        ordering = {rid: i for i, rid in enumerate(sorted(resources))}
+        self._ordering = dict(ordering)
+        return ordering
     
     def check_ordering_violation(self, pid: int, rid: int,
                                   held_resources: List[int],
-                                  ordering: Dict[int, int]) -> bool:
+                                  ordering: Optional[Dict[int, int]] = None) -> bool:
         """Check if requesting a resource would violate the ordering.
         
+        Without an explicit ordering, the one from the last
+        apply_resource_ordering call is used.
+        
         Returns True if there's a violation (request should be denied).
         """
+        if ordering is None:
+            ordering = self._ordering
+        
         request_order = ordering.get(rid, float('inf'))
         
         for held_rid in held_resources:
@@ -248,3 +266,4 @@ class DeadlockResolver:
         self.resolution_history.clear()
         self.process_priorities.clear()
         self.process_rollback_costs.clear()
+        self._ordering = {}
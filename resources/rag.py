@@ -1,8 +1,42 @@
 """Resource Allocation Graph (RAG) implementation for OS simulation."""
 
 from typing import Dict, List, Set, Tuple, Optional
+from collections import defaultdict
 from dataclasses import dataclass, field
-from enum import Enum
+from enum import Enum, IntEnum
+from itertools import chain
+
+
+# Node keys are packed ints: a resource node is keyed by its rid, a process
+# node by its pid with the high bit set.
+PROCESS_NODE_BIT = 1 << 31
+NODE_ID_MASK = PROCESS_NODE_BIT - 1
+
+
+def process_node(pid: int) -> int:
+    """Node key for a process."""
+    return pid | PROCESS_NODE_BIT
+
+
+def resource_node(rid: int) -> int:
+    """Node key for a resource."""
+    return rid
+
+
+def node_entity_id(node_id: int) -> int:
+    """Process or resource ID encoded in a node key."""
+    return node_id & NODE_ID_MASK
+
+
+def node_label(node_id: int) -> str:
+    """Display label for a node key ("P3" / "R7")."""
+    if node_id & PROCESS_NODE_BIT:
+        return f"P{node_entity_id(node_id)}"
+    return f"R{node_id}"
+
+
+_EMPTY_ASCII = "\n".join(["Resource Allocation Graph:", "=" * 40,
+                          "\nProcesses:", "\nResources:", "\nEdges:"])
 
 
 class NodeType(Enum):
@@ -11,10 +45,16 @@ class NodeType(Enum):
     RESOURCE = "resource"
 
 
-@dataclass
+class EdgeType(IntEnum):
+    """Type of edge in the RAG."""
+    REQUEST = 0     # P -> R
+    ASSIGNMENT = 1  # R -> P
+
+
+@dataclass(slots=True)
 class Node:
     """A node in the Resource Allocation Graph."""
-    node_id: str
+    node_id: int
     node_type: NodeType
     name: str
     
@@ -23,12 +63,12 @@ class Node:
     available_instances: int = 1
 
 
-@dataclass
+@dataclass(slots=True)
 class Edge:
     """An edge in the Resource Allocation Graph."""
-    from_node: str
-    to_node: str
-    edge_type: str  # 'request' (P -> R) or 'assignment' (R -> P)
+    from_node: int
+    to_node: int
+    edge_type: EdgeType
     count: int = 1
     timestamp: int = 0
 
@@ -37,24 +77,51 @@ class ResourceAllocationGraph:
     """Resource Allocation Graph for deadlock detection and visualization."""
     
     def __init__(self):
-        self.nodes: Dict[str, Node] = {}
-        self.edges: List[Edge] = []
-        self.adjacency_list: Dict[str, List[str]] = {}  # For cycle detection
+        self.nodes: Dict[int, Node] = {}
+        self.adjacency_list: Dict[int, Set[int]] = {}  # For cycle detection
+        
+        # Edge indexes: request edges keyed by (pid, rid), assignment
+        # edges keyed by (rid, pid)
+        self._req: Dict[Tuple[int, int], Edge] = {}
+        self._asg: Dict[Tuple[int, int], Edge] = {}
+        
+        # Reverse indexes over the edge sets, as dicts used as ordered sets
+        # so lookups follow edge insertion order
+        self._requested: Dict[int, Dict[int, None]] = defaultdict(dict)  # pid -> requested rids
+        self._held_by: Dict[int, Dict[int, None]] = defaultdict(dict)  # pid -> held rids
+        self._holders: Dict[int, Dict[int, None]] = defaultdict(dict)  # rid -> holder pids
+        
+        # Bumped on every mutation; keys the cached wait-for graph
+        self._generation: int = 0
+        self._wfg_cache: Optional[Tuple[int, Dict[int, List[int]]]] = None
+        self._ascii_cache: Optional[Tuple[int, str]] = None
+    
+    @property
+    def generation(self) -> int:
+        """Mutation counter; changes whenever the graph changes."""
+        return self._generation
+    
+    @property
+    def edges(self) -> List[Edge]:
+        """All edges in the graph (assignment edges first, then requests)."""
+        return list(chain(self._asg.values(), self._req.values()))
     
     def add_process(self, pid: int, name: str = None) -> None:
         """Add a process node to the graph."""
-        node_id = f"P{pid}"
+        self._generation += 1
+        node_id = process_node(pid)
         if node_id not in self.nodes:
             self.nodes[node_id] = Node(
                 node_id=node_id,
                 node_type=NodeType.PROCESS,
                 name=name or f"Process {pid}"
             )
-            self.adjacency_list[node_id] = []
+            self.adjacency_list[node_id] = set()
     
     def add_resource(self, rid: int, name: str = None, instances: int = 1) -> None:
         """Add a resource node to the graph."""
-        node_id = f"R{rid}"
+        self._generation += 1
+        node_id = resource_node(rid)
         if node_id not in self.nodes:
             self.nodes[node_id] = Node(
                 node_id=node_id,
@@ -63,13 +130,14 @@ class ResourceAllocationGraph:
                 total_instances=instances,
                 available_instances=instances
             )
-            self.adjacency_list[node_id] = []
+            self.adjacency_list[node_id] = set()
     
     def add_request_edge(self, pid: int, rid: int, count: int = 1, 
                          timestamp: int = 0) -> None:
         """Add a request edge from process to resource (P -> R)."""
-        from_node = f"P{pid}"
-        to_node = f"R{rid}"
+        self._generation += 1
+        from_node = process_node(pid)
+        to_node = resource_node(rid)
         
         # Ensure nodes exist
         if from_node not in self.nodes:
@@ -78,22 +146,22 @@ class ResourceAllocationGraph:
             self.add_resource(rid)
         
         # Check if edge already exists
-        for edge in self.edges:
-            if (edge.from_node == from_node and edge.to_node == to_node 
-                and edge.edge_type == 'request'):
-                edge.count += count
-                return
+        edge = self._req.get((pid, rid))
+        if edge is not None:
+            edge.count += count
+            return
         
         # Add new edge
-        edge = Edge(from_node, to_node, 'request', count, timestamp)
-        self.edges.append(edge)
-        self.adjacency_list[from_node].append(to_node)
+        self._req[(pid, rid)] = Edge(from_node, to_node, EdgeType.REQUEST, count, timestamp)
+        self._requested[pid][rid] = None
+        self.adjacency_list[from_node].add(to_node)
     
     def add_assignment_edge(self, rid: int, pid: int, count: int = 1,
                            timestamp: int = 0) -> None:
         """Add an assignment edge from resource to process (R -> P)."""
-        from_node = f"R{rid}"
-        to_node = f"P{pid}"
+        self._generation += 1
+        from_node = resource_node(rid)
+        to_node = process_node(pid)
         
         # Ensure nodes exist
         if from_node not in self.nodes:
@@ -102,73 +170,73 @@ class ResourceAllocationGraph:
             self.add_process(pid)
         
         # Check if edge already exists
-        for edge in self.edges:
-            if (edge.from_node == from_node and edge.to_node == to_node 
-                and edge.edge_type == 'assignment'):
-                edge.count += count
-                return
+        edge = self._asg.get((rid, pid))
+        if edge is not None:
+            edge.count += count
+            return
         
         # Add new edge
-        edge = Edge(from_node, to_node, 'assignment', count, timestamp)
-        self.edges.append(edge)
-        self.adjacency_list[from_node].append(to_node)
+        self._asg[(rid, pid)] = Edge(from_node, to_node, EdgeType.ASSIGNMENT, count, timestamp)
+        self._held_by[pid][rid] = None
+        self._holders[rid][pid] = None
+        self.adjacency_list[from_node].add(to_node)
         
         # Update resource availability
-        if from_node in self.nodes:
-            self.nodes[from_node].available_instances -= count
+        self.nodes[from_node].available_instances -= count
     
     def remove_request_edge(self, pid: int, rid: int, count: int = 1) -> bool:
         """Remove a request edge."""
-        from_node = f"P{pid}"
-        to_node = f"R{rid}"
+        self._generation += 1
+        edge = self._req.get((pid, rid))
+        if edge is None:
+            return False
         
-        for i, edge in enumerate(self.edges):
-            if (edge.from_node == from_node and edge.to_node == to_node 
-                and edge.edge_type == 'request'):
-                if edge.count <= count:
-                    self.edges.pop(i)
-                    if to_node in self.adjacency_list[from_node]:
-                        self.adjacency_list[from_node].remove(to_node)
-                else:
-                    edge.count -= count
-                return True
-        return False
+        if edge.count <= count:
+            del self._req[(pid, rid)]
+            self._requested[pid].pop(rid, None)
+            self.adjacency_list[edge.from_node].discard(edge.to_node)
+        else:
+            edge.count -= count
+        return True
     
     def remove_assignment_edge(self, rid: int, pid: int, count: int = 1) -> bool:
         """Remove an assignment edge."""
-        from_node = f"R{rid}"
-        to_node = f"P{pid}"
+        self._generation += 1
+        edge = self._asg.get((rid, pid))
+        if edge is None:
+            return False
         
-        for i, edge in enumerate(self.edges):
-            if (edge.from_node == from_node and edge.to_node == to_node 
-                and edge.edge_type == 'assignment'):
-                if edge.count <= count:
-                    self.edges.pop(i)
-                    if to_node in self.adjacency_list[from_node]:
-                        self.adjacency_list[from_node].remove(to_node)
-                else:
-                    edge.count -= count
-                
-                # Update resource availability
-                if from_node in self.nodes:
-                    self.nodes[from_node].available_instances += count
-                return True
-        return False
+        if edge.count <= count:
+            del self._asg[(rid, pid)]
+            self._held_by[pid].pop(rid, None)
+            self._holders[rid].pop(pid, None)
+            self.adjacency_list[edge.from_node].discard(edge.to_node)
+        else:
+            edge.count -= count
+        
+        # Update resource availability
+        if edge.from_node in self.nodes:
+            self.nodes[edge.from_node].available_instances += count
+        return True
     
     def remove_process(self, pid: int) -> None:
         """Remove a process and all its edges from the graph."""
-        node_id = f"P{pid}"
+        self._generation += 1
+        node_id = process_node(pid)
         
-        # Remove all edges involving this process
-        self.edges = [e for e in self.edges 
-                      if e.from_node != node_id and e.to_node != node_id]
+        # Remove all edges involving this process, returning held instances.
+        # Assignment edges are the only edges into a process node.
+        for rid in self._held_by.pop(pid, ()):
+            edge = self._asg.pop((rid, pid))
+            self._holders[rid].pop(pid, None)
+            self.adjacency_list[edge.from_node].discard(node_id)
+            if edge.from_node in self.nodes:
+                self.nodes[edge.from_node].available_instances += edge.count
+        for rid in self._requested.pop(pid, ()):
+            del self._req[(pid, rid)]
         
-        # Update adjacency list
-        if node_id in self.adjacency_list:
-            del self.adjacency_list[node_id]
-        for node, neighbors in self.adjacency_list.items():
-            if node_id in neighbors:
-                neighbors.remove(node_id)
+        # Drop the node's own (request) adjacency
+        self.adjacency_list.pop(node_id, None)
         
         # Remove node
         if node_id in self.nodes:
@@ -177,93 +245,114 @@ class ResourceAllocationGraph:
     def get_request_edges(self, pid: int = None) -> List[Edge]:
         """Get all request edges, optionally filtered by process."""
         if pid is None:
-            return [e for e in self.edges if e.edge_type == 'request']
-        node_id = f"P{pid}"
-        return [e for e in self.edges 
-                if e.edge_type == 'request' and e.from_node == node_id]
+            return list(self._req.values())
+        return [self._req[(pid, r)] for r in self._requested.get(pid, ())]
     
     def get_assignment_edges(self, pid: int = None, rid: int = None) -> List[Edge]:
         """Get all assignment edges, optionally filtered."""
-        edges = [e for e in self.edges if e.edge_type == 'assignment']
+        if pid is not None and rid is not None:
+            edge = self._asg.get((rid, pid))
+            return [edge] if edge is not None else []
         if pid is not None:
-            edges = [e for e in edges if e.to_node == f"P{pid}"]
+            return [self._asg[(r, pid)] for r in self._held_by.get(pid, ())]
         if rid is not None:
-            edges = [e for e in edges if e.from_node == f"R{rid}"]
-        return edges
+            return [self._asg[(rid, p)] for p in self._holders.get(rid, ())]
+        return list(self._asg.values())
+    
+    def get_assignment_edge(self, rid: int, pid: int) -> Optional[Edge]:
+        """Get the assignment edge R -> P, or None if it does not exist."""
+        return self._asg.get((rid, pid))
     
     def get_processes_holding_resource(self, rid: int) -> List[int]:
         """Get list of process IDs holding a resource."""
-        node_id = f"R{rid}"
-        pids = []
-        for edge in self.edges:
-            if edge.from_node == node_id and edge.edge_type == 'assignment':
-                pid = int(edge.to_node[1:])
-                pids.append(pid)
-        return pids
+        return list(self._holders.get(rid, ()))
     
     def get_resources_held_by_process(self, pid: int) -> List[int]:
         """Get list of resource IDs held by a process."""
-        node_id = f"P{pid}"
-        rids = []
-        for edge in self.edges:
-            if edge.to_node == node_id and edge.edge_type == 'assignment':
-                rid = int(edge.from_node[1:])
-                rids.append(rid)
-        return rids
+        return list(self._held_by.get(pid, ()))
+    
+    def has_blocked_request(self) -> bool:
+        """Check whether any requested resource is currently held.
+        
+        Every wait-for edge comes from such a request, so without one the
+        graph cannot contain a deadlock.
+        """
+        holders = self._holders
+        return any(holders.get(rid) for _, rid in self._req)
     
     def get_wait_for_graph(self) -> Dict[int, List[int]]:
         """Create a wait-for graph from the RAG.
         
+        The result is cached until the next mutation and must be treated
+        as read-only.
+        
         Returns: {pid: [pids that this process is waiting for]}
         """
-        wait_for: Dict[int, List[int]] = {}
+        cache = self._wfg_cache
+        if cache is not None and cache[0] == self._generation:
+            return cache[1]
+        
+        # Ordered per-process sets of holders, keyed by the waiting pid;
+        # holders keep assignment edge order
+        waits: Dict[int, Dict[int, None]] = {}
+        holders = self._holders
         
-        # For each request edge P -> R
-        for req_edge in self.get_request_edges():
-            pid = int(req_edge.from_node[1:])
-            rid = int(req_edge.to_node[1:])
-            
-            if pid not in wait_for:
-                wait_for[pid] = []
-            
-            # Find who holds this resource
-            for assign_edge in self.edges:
-                if (assign_edge.from_node == req_edge.to_node and 
-                    assign_edge.edge_type == 'assignment'):
-                    holder_pid = int(assign_edge.to_node[1:])
-                    if holder_pid != pid and holder_pid not in wait_for[pid]:
-                        wait_for[pid].append(holder_pid)
+        # For each request edge P -> R, P waits on every holder of R
+        for pid, rid in self._req:
+            targets = waits.get(pid)
+            if targets is None:
+                targets = waits[pid] = {}
+            targets.update(holders.get(rid, {}))
+            targets.pop(pid, None)
         
+        wait_for = {pid: list(targets) for pid, targets in waits.items()}
+        self._wfg_cache = (self._generation, wait_for)
         return wait_for
     
     def to_ascii(self) -> str:
-        """Generate ASCII representation of the graph."""
-        lines = ["Resource Allocation Graph:", "=" * 40]
+        """Generate ASCII representation of the graph.
+        
+        The text is cached until the next mutation.
+        """
+        cache = self._ascii_cache
+        if cache is not None and cache[0] == self._generation:
+            return cache[1]
         
-        # List processes
-        processes = [n for n in self.nodes.values() if n.node_type == NodeType.PROCESS]
-        resources = [n for n in self.nodes.values() if n.node_type == NodeType.RESOURCE]
+        if not self.nodes:
+            text = _EMPTY_ASCII
+        else:
+            text = "\n".join(self._ascii_lines())
+        self._ascii_cache = (self._generation, text)
+        return text
+    
+    def _ascii_lines(self) -> List[str]:
+        """Lines of the ASCII representation."""
+        lines = ["Resource Allocation Graph:", "=" * 40]
+        nodes = self.nodes.values()
         
         lines.append("\nProcesses:")
-        for p in processes:
-            lines.append(f"  [{p.node_id}] {p.name}")
+        lines.extend(f"  [{node_label(p.node_id)}] {p.name}"
+                     for p in nodes if p.node_type == NodeType.PROCESS)
         
         lines.append("\nResources:")
-        for r in resources:
-            lines.append(f"  ({r.node_id}) {r.name} "
-                        f"[{r.available_instances}/{r.total_instances} available]")
+        lines.extend(f"  ({node_label(r.node_id)}) {r.name} "
+                     f"[{r.available_instances}/{r.total_instances} available]"
+                     for r in nodes if r.node_type == NodeType.RESOURCE)
         
         lines.append("\nEdges:")
-        for edge in self.edges:
-            if edge.edge_type == 'request':
-                lines.append(f"  {edge.from_node} --wants--> {edge.to_node} (count: {edge.count})")
-            else:
-                lines.append(f"  {edge.from_node} --held-by--> {edge.to_node} (count: {edge.count})")
-        
-        return "\n".join(lines)
+        lines.extend(f"  {node_label(e.from_node)} --held-by--> {node_label(e.to_node)} "
+                     f"(count: {e.count})" for e in self._asg.values())
+        lines.extend(f"  {node_label(e.from_node)} --wants--> {node_label(e.to_node)} "
+                     f"(count: {e.count})" for e in self._req.values())
+        return lines
     
     def reset(self) -> None:
         """Reset the graph to empty state."""
+        self._generation += 1
         self.nodes.clear()
-        self.edges.clear()
         self.adjacency_list.clear()
+        self._req.clear()
+        self._asg.clear()
+        self._requested.clear()
+        self._held_by.clear()
+        self._holders.clear()
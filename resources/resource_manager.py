@@ -1,12 +1,14 @@
 """Resource Manager for OS simulation."""
 
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+from array import array
+from collections import defaultdict
 from dataclasses import dataclass, field
 from models.resource import Resource, ResourceType
 from models.process import Process
 
 
-@dataclass
+@dataclass(slots=True)
 class AllocationEvent:
     """Record of a resource allocation event."""
     timestamp: int
@@ -19,28 +21,80 @@ class AllocationEvent:
     message: str = ""
 
 
+# Event types stored as small integer codes in the history columns
+EVENT_TYPES = ('allocate', 'release', 'request', 'deny')
+_EVENT_CODES = {name: code for code, name in enumerate(EVENT_TYPES)}
+
+# Default system resources: (rid, name, type, instances)
+_DEFAULT_RESOURCES = (
+    (1, "CPU", ResourceType.CPU, 4),
+    (2, "Memory", ResourceType.MEMORY, 16),  # 16 memory units
+    (3, "Printer", ResourceType.PRINTER, 2),
+    (4, "Disk", ResourceType.DISK, 4),
+)
+
+
+class _AllocationHistoryView(Sequence):
+    """Lazy sequence over a ResourceManager's allocation history."""
+    
+    __slots__ = ('_manager',)
+    
+    def __init__(self, manager: 'ResourceManager'):
+        self._manager = manager
+    
+    def __len__(self) -> int:
+        return len(self._manager._hist_ts)
+    
+    def __getitem__(self, index):
+        size = len(self)
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(size))]
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("allocation history index out of range")
+        return self._manager._history_event(index)
+
+
 class ResourceManager:
     """Manages resources and their allocation to processes."""
     
-    def __init__(self):
+    # Maximum number of allocation events retained; the oldest are overwritten
+    HISTORY_CAPACITY = 1 << 16
+    
+    def __init__(self, with_defaults: bool = True):
         self.resources: Dict[int, Resource] = {}
         self.processes: Dict[int, Process] = {}
-        self.allocation_history: List[AllocationEvent] = []
         self.current_time: int = 0
         
+        # Allocation history as a ring buffer of parallel columns
+        self._hist_pos = 0  # Total events logged
+        self._hist_ts = array('q')
+        self._hist_pid = array('q')
+        self._hist_rid = array('q')
+        self._hist_count = array('q')
+        self._hist_type = array('B')
+        self._hist_success = array('B')
+        self._hist_name: List[str] = []
+        self._hist_message: List[str] = []
+        
+        # pid -> rids currently allocated to the process. Kept by
+        # request/release/release_all; allocations made directly on a
+        # Resource are not indexed (release_all falls back to a scan)
+        self._held_by_pid: Dict[int, Set[int]] = defaultdict(set)
+        
         # Initialize default resources
-        self._init_default_resources()
+        if with_defaults:
+            self._init_default_resources()
+    
+    @classmethod
+    def empty(cls) -> 'ResourceManager':
+        """Create a resource manager without the default resources."""
+        return cls(with_defaults=False)
     
     def _init_default_resources(self) -> None:
         """Initialize the default system resources."""
-        default_resources = [
-            (1, "CPU", ResourceType.CPU, 4),
-            (2, "Memory", ResourceType.MEMORY, 16),  # 16 memory units
-            (3, "Printer", ResourceType.PRINTER, 2),
-            (4, "Disk", ResourceType.DISK, 4)
-        ]
-        
-        for rid, name, rtype, instances in default_resources:
+        for rid, name, rtype, instances in _DEFAULT_RESOURCES:
             self.add_resource(Resource(rid, name, rtype, instances))
     
     def add_resource(self, resource: Resource) -> None:
@@ -86,6 +140,8 @@ class ResourceManager:
         if resource.is_available(count):
             success = resource.allocate(pid, count)
             if success:
+                self._held_by_pid[pid].add(rid)
+                
                 # Update process allocation tracking
                 if pid in self.processes:
                     process = self.processes[pid]
@@ -125,6 +181,9 @@ class ResourceManager:
         released = resource.release(pid, count)
         
         if released > 0:
+            if resource.get_allocated_count(pid) == 0 and pid in self._held_by_pid:
+                self._held_by_pid[pid].discard(rid)
+            
             # Update process allocation tracking
             if pid in self.processes:
                 process = self.processes[pid]
@@ -143,8 +202,18 @@ class ResourceManager:
         
         Returns a dict of resource_id -> released_count.
         """
+        held = self._held_by_pid.pop(pid, None)
+        if not held:
+            # Nothing indexed; the process may still have been allocated
+            # directly through Resource.allocate
+            held = [rid for rid, resource in self.resources.items()
+                    if pid in resource.allocated_to]
+        
         released = {}
-        for rid, resource in self.resources.items():
+        for rid in sorted(held):
+            resource = self.resources.get(rid)
+            if resource is None:
+                continue
             count = resource.release(pid)
             if count > 0:
                 released[rid] = count
@@ -158,6 +227,13 @@ class ResourceManager:
         
         return released
     
+    def get_held_resources(self, pid: int) -> List[int]:
+        """Get the resource IDs a process currently holds.
+        
+        Only allocations made through this manager are included.
+        """
+        return sorted(self._held_by_pid.get(pid, ()))
+    
     def get_allocation_matrix(self) -> Dict[int, Dict[int, int]]:
         """Get the current allocation matrix.
         
@@ -218,17 +294,56 @@ class ResourceManager:
                    resource_name: str, count: int, success: bool,
                    message: str = "") -> None:
         """Log a resource allocation event."""
-        event = AllocationEvent(
-            timestamp=self.current_time,
-            event_type=event_type,
-            process_id=pid,
-            resource_id=rid,
-            resource_name=resource_name,
-            count=count,
-            success=success,
-            message=message
+        pos = self._hist_pos
+        row = (self.current_time, pid, rid, count,
+               _EVENT_CODES[event_type], success, resource_name, message)
+        columns = self._history_columns()
+        
+        if pos < self.HISTORY_CAPACITY:
+            for column, value in zip(columns, row):
+                column.append(value)
+        else:
+            slot = pos % self.HISTORY_CAPACITY
+            for column, value in zip(columns, row):
+                column[slot] = value
+        
+        self._hist_pos = pos + 1
+    
+    def _history_columns(self) -> Tuple:
+        """History columns, in AllocationEvent field order."""
+        return (self._hist_ts, self._hist_pid, self._hist_rid, self._hist_count,
+                self._hist_type, self._hist_success, self._hist_name,
+                self._hist_message)
+    
+    def _history_event(self, index: int) -> AllocationEvent:
+        """Materialize the index-th retained event, oldest first."""
+        size = len(self._hist_ts)
+        start = self._hist_pos % size if self._hist_pos > size else 0
+        i = (start + index) % size
+        return AllocationEvent(
+            timestamp=self._hist_ts[i],
+            event_type=EVENT_TYPES[self._hist_type[i]],
+            process_id=self._hist_pid[i],
+            resource_id=self._hist_rid[i],
+            resource_name=self._hist_name[i],
+            count=self._hist_count[i],
+            success=bool(self._hist_success[i]),
+            message=self._hist_message[i]
         )
-        self.allocation_history.append(event)
+    
+    def get_history(self) -> List[AllocationEvent]:
+        """Get the retained allocation events, oldest first."""
+        return list(self.allocation_history)
+    
+    @property
+    def allocation_history(self) -> Sequence[AllocationEvent]:
+        """Read-only view of the allocation events, oldest first.
+        
+        Events are built from the history columns only as they are
+        indexed or iterated, so reading len() or the latest entry does not
+        copy the whole history.
+        """
+        return _AllocationHistoryView(self)
     
     def set_time(self, time: int) -> None:
         """Set the current simulation time."""
@@ -239,5 +354,8 @@ class ResourceManager:
         for resource in self.resources.values():
             resource.reset()
         self.processes.clear()
-        self.allocation_history.clear()
+        for column in self._history_columns():
+            del column[:]
+        self._hist_pos = 0
+        self._held_by_pid.clear()
         self.current_time = 0
@@ -1,8 +1,15 @@
 """Adaptive Scheduler Selector for OS simulation."""
 
-from typing import List, Tuple, Optional, Type, Dict
+from typing import Callable, List, Tuple, Dict
+from array import array
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
-import statistics
+from enum import IntEnum
+from functools import cached_property, partial
+from itertools import chain, repeat
+from operator import attrgetter
+import heapq
+import math
 
 from models.process import Process
 from .base_scheduler import BaseScheduler, SchedulingResult
@@ -14,9 +21,58 @@ from .priority_scheduler import PriorityScheduler, PreemptivePriorityScheduler
 from .mlfq_scheduler import MLFQScheduler
 
 
-@dataclass
+# Process attributes the workload analysis depends on, as one row per process
+_workload_row = attrgetter('burst_time', 'priority', 'arrival_time', 'io_bound')
+
+
+
+class AlgoKind(IntEnum):
+    """Scheduling algorithm a PerformanceEstimate refers to."""
+    FCFS = 0
+    SJF = 1
+    SRTF = 2
+    RR = 3
+    PRIORITY = 4
+    PREEMPTIVE_PRIORITY = 5
+    MLFQ = 6
+
+
+# Which top-3 estimates select_scheduler prefers, keyed by
+# (priority criteria met, I/O ratio > 0.3, interactive or I/O ratio > 0.5).
+# Each entry lists tiers of algorithm kinds, best tier first; within a tier
+# the higher-ranked estimate wins, and with no match the best performer is kept.
+_PRIORITY_TIERS = ((AlgoKind.PREEMPTIVE_PRIORITY,), (AlgoKind.PRIORITY,))
+_INTERACTIVE_TIERS = ((AlgoKind.RR, AlgoKind.MLFQ),)
+_PREFERENCE_TABLE = {
+    (True, True, True): _PRIORITY_TIERS,
+    (True, True, False): _PRIORITY_TIERS,
+    (True, False, True): ((AlgoKind.PRIORITY,),),
+    (True, False, False): ((AlgoKind.PRIORITY,),),
+    (False, True, True): _INTERACTIVE_TIERS,
+    (False, True, False): (),
+    (False, False, True): _INTERACTIVE_TIERS,
+    (False, False, False): (),
+}
+
+
+# Ranking key for PerformanceEstimate
+_estimated_wait = attrgetter('estimated_wait_time')
+
+
+def _run_scheduler(factory, processes: List[Process]) -> SchedulingResult:
+    """Run one compare_all scheduler; module-level so worker processes can pickle it."""
+    scheduler = factory()
+    # Only the metrics are compared, so skip building the event log
+    scheduler.logging_enabled = False
+    return scheduler.schedule(processes)
+
+
+@dataclass(frozen=True)
 class WorkloadAnalysis:
-    """Analysis of process workload characteristics."""
+    """Analysis of process workload characteristics.
+    
+    Frozen, since analyses are cached and shared between callers.
+    """
     process_count: int
     avg_burst_time: float
     burst_time_variance: float
@@ -30,22 +86,46 @@ class WorkloadAnalysis:
     is_batch: bool
 
 
+# Analysis of an empty workload, shared by every empty call
+_EMPTY_ANALYSIS = WorkloadAnalysis(
+    process_count=0, avg_burst_time=0, burst_time_variance=0,
+    coefficient_of_variation=0, priority_range=0, priority_variance=0,
+    io_bound_ratio=0, cpu_bound_ratio=0, avg_arrival_spread=0,
+    is_interactive=False, is_batch=False
+)
+
+
 @dataclass
 class SchedulerRecommendation:
-    """Recommendation for scheduler selection."""
-    scheduler: BaseScheduler
+    """Recommendation for scheduler selection.
+    
+    The scheduler instance and the justification text are built on first
+    access, so callers only pay for the parts they use.
+    """
+    scheduler_factory: Callable[[], BaseScheduler]
     algorithm_name: str
-    justification: str
+    justification_factory: Callable[[], str]
     expected_avg_wait: float
     confidence: float  # 0.0 to 1.0
+    
+    @cached_property
+    def scheduler(self) -> BaseScheduler:
+        """The recommended scheduler, configured and ready to run."""
+        return self.scheduler_factory()
+    
+    @cached_property
+    def justification(self) -> str:
+        """Human-readable explanation of the recommendation."""
+        return self.justification_factory()
 
 
-@dataclass
+@dataclass(slots=True)
 class PerformanceEstimate:
     """Performance estimate for an algorithm."""
-    algorithm: str
+    algorithm: str  # Display name
     estimated_wait_time: float
     scheduler_class: type
+    kind: AlgoKind
 
 
 class AdaptiveSelector:
@@ -60,6 +140,23 @@ class AdaptiveSelector:
     PRIORITY_VARIANCE_THRESHOLD = 6
     PRIORITY_RANGE_THRESHOLD = 7
     
+    # Number of workload analyses kept; the least recently used is evicted
+    ANALYSIS_CACHE_SIZE = 128
+    
+    # Initial divisor of each algorithm's wait estimate (see _estimate_scales)
+    DEFAULT_WAIT_DIVISORS = {
+        'FCFS': 2,
+        'SJF': 3,
+        'SRTF': 4,
+        'RR': 2,
+        'Priority': 3,
+        'PreemptivePriority': 4,
+        'MLFQ': 3
+    }
+    
+    # Weight of a new observation in learn_from_results
+    LEARNING_RATE = 0.1
+    
     def __init__(self):
         self.schedulers = {
             'FCFS': FCFSScheduler,
@@ -70,43 +167,83 @@ class AdaptiveSelector:
             'PreemptivePriority': PreemptivePriorityScheduler,
             'MLFQ': MLFQScheduler
         }
+        
+        self.wait_divisors: Dict[str, float] = dict(self.DEFAULT_WAIT_DIVISORS)
+        
+        # Workload fingerprint -> analysis, least recently used first
+        self._analysis_cache: Dict[bytes, WorkloadAnalysis] = {}
     
     def analyze_workload(self, processes: List[Process]) -> WorkloadAnalysis:
-        """Analyze the characteristics of the process workload."""
-        if not processes:
-            return WorkloadAnalysis(
-                process_count=0, avg_burst_time=0, burst_time_variance=0,
-                coefficient_of_variation=0, priority_range=0, priority_variance=0,
-                io_bound_ratio=0, cpu_bound_ratio=0, avg_arrival_spread=0,
-                is_interactive=False, is_batch=False
-            )
+        """Analyze the characteristics of the process workload.
         
-        n = len(processes)
-        burst_times = [p.burst_time for p in processes]
-        priorities = [p.priority for p in processes]
-        arrival_times = sorted([p.arrival_time for p in processes])
+        Results are cached by the processes' static attributes, so
+        repeated calls on an unchanged workload are not recomputed.
+        """
+        if not processes:
+            return _EMPTY_ANALYSIS
+        
+        rows = tuple(map(_workload_row, processes))
+        # Packed doubles: 8 bytes per attribute instead of a tuple of objects
+        key = array('d', chain.from_iterable(rows)).tobytes()
+        cache = self._analysis_cache
+        analysis = cache.pop(key, None)
+        if analysis is None:
+            analysis = self._compute_analysis(rows)
+            if len(cache) >= self.ANALYSIS_CACHE_SIZE:
+                del cache[next(iter(cache))]
+        cache[key] = analysis  # (Re)insert as most recently used
+        return analysis
+    
+    def _compute_analysis(self, rows: Tuple[tuple, ...]) -> WorkloadAnalysis:
+        """Compute the workload statistics from non-empty workload rows.
         
-        # Basic statistics
-        avg_burst = statistics.mean(burst_times)
-        burst_variance = statistics.variance(burst_times) if n > 1 else 0
-        burst_stdev = statistics.stdev(burst_times) if n > 1 else 0
+        Each row is (burst_time, priority, arrival_time, io_bound), so the
+        loop works on plain numbers without attribute lookups.
+        """
+        n = len(rows)
+        
+        # One pass accumulating sums, sums of squares and the priority and
+        # arrival ranges
+        burst_sum = burst_sq = 0
+        prio_sum = prio_sq = 0
+        prio_min = prio_max = rows[0][1]
+        arrival_min = arrival_max = rows[0][2]
+        io_count = 0
+        for burst, prio, arrival, io_bound in rows:
+            burst_sum += burst
+            burst_sq += burst * burst
+            prio_sum += prio
+            prio_sq += prio * prio
+            if prio < prio_min:
+                prio_min = prio
+            elif prio > prio_max:
+                prio_max = prio
+            if arrival < arrival_min:
+                arrival_min = arrival
+            elif arrival > arrival_max:
+                arrival_max = arrival
+            if io_bound:
+                io_count += 1
+        
+        # Basic statistics (sample variance from the sums)
+        avg_burst = burst_sum / n
+        if n > 1:
+            burst_variance = (n * burst_sq - burst_sum * burst_sum) / (n * (n - 1))
+            priority_variance = (n * prio_sq - prio_sum * prio_sum) / (n * (n - 1))
+        else:
+            burst_variance = priority_variance = 0
+        burst_stdev = math.sqrt(burst_variance)
         cv = burst_stdev / avg_burst if avg_burst > 0 else 0
         
-        priority_range = max(priorities) - min(priorities) if n > 0 else 0
-        priority_variance = statistics.variance(priorities) if n > 1 else 0
+        priority_range = prio_max - prio_min
         
         # I/O vs CPU bound ratio
-        io_count = sum(1 for p in processes if p.io_bound)
         io_ratio = io_count / n
         cpu_ratio = 1 - io_ratio
         
-        # Arrival spread
-        if n > 1:
-            arrival_diffs = [arrival_times[i+1] - arrival_times[i] 
-                           for i in range(len(arrival_times)-1)]
-            avg_spread = statistics.mean(arrival_diffs) if arrival_diffs else 0
-        else:
-            avg_spread = 0
+        # Arrival spread: the mean gap between sorted arrivals telescopes
+        # to (last - first) / (n - 1), so no sort is needed
+        avg_spread = (arrival_max - arrival_min) / (n - 1) if n > 1 else 0
         
         # Classification
         is_interactive = avg_burst < 50 and io_ratio > 0.3
@@ -126,71 +263,91 @@ class AdaptiveSelector:
             is_batch=is_batch
         )
     
-    def _estimate_performance(self, processes: List[Process], 
-                              analysis: WorkloadAnalysis) -> Dict[str, PerformanceEstimate]:
+    def _estimate_scales(self, analysis: WorkloadAnalysis) -> Dict[str, Tuple[float, float]]:
+        """Workload-dependent terms of each algorithm's waiting time.
+        
+        Returns {name: (base, adjustment)}; the estimated wait is
+        base / wait divisor * adjustment.
+        """
+        n = analysis.process_count
+        cv = analysis.coefficient_of_variation
+        io_heavy = analysis.io_bound_ratio > 0.3
+        
+        # Total burst time of the other processes and of all processes
+        others_burst = analysis.avg_burst_time * (n - 1)
+        total_burst = analysis.avg_burst_time * n
+        
+        return {
+            # FCFS: Convoy effect makes this worse with high variance
+            'FCFS': (others_burst, 1 + cv * 0.3 if cv > 0.5 else 1),
+            # SJF: Optimal for non-preemptive - better with sorted short jobs
+            'SJF': (others_burst, 1),
+            # SRTF: Best case, preemptive version of SJF
+            'SRTF': (others_burst, 1),
+            # RR is better for interactive (I/O-bound) workloads
+            'RR': (total_burst, 0.8 if io_heavy else 1),
+            # Priority: Worse if priorities are similar (less meaningful ordering)
+            'Priority': (others_burst, 1.3 if analysis.priority_variance < 3 else 1),
+            # Preemptive Priority: Better with high I/O ratio
+            'PreemptivePriority': (others_burst, 0.9 if io_heavy else 1),
+            # MLFQ: Scales better with many processes
+            'MLFQ': (total_burst, 0.9 if n > 10 else 1),
+        }
+    
+    def _estimate_performance(self, analysis: WorkloadAnalysis) -> Dict[str, PerformanceEstimate]:
         """Estimate avg waiting time for ALL 7 algorithms.
         
         Args:
-            processes: List of processes to analyze
             analysis: Pre-computed workload analysis
             
         Returns:
             Dictionary mapping algorithm name to PerformanceEstimate
         """
-        n = analysis.process_count
-        avg_burst = analysis.avg_burst_time
-        cv = analysis.coefficient_of_variation
-        
-        estimates = {}
-        
-        # FCFS: Average waiting time approximation
-        # Convoy effect makes this worse with high variance
-        fcfs_wait = avg_burst * (n - 1) / 2
-        if cv > 0.5:
-            fcfs_wait *= (1 + cv * 0.3)  # Penalize for high variance
-        estimates['FCFS'] = PerformanceEstimate('FCFS', fcfs_wait, FCFSScheduler)
-        
-        # SJF: Optimal for non-preemptive - better with sorted short jobs
-        sjf_wait = avg_burst * (n - 1) / 3
-        estimates['SJF'] = PerformanceEstimate('SJF', sjf_wait, SJFScheduler)
-        
-        # SRTF: Best case, preemptive version of SJF
-        srtf_wait = avg_burst * (n - 1) / 4
-        estimates['SRTF'] = PerformanceEstimate('SRTF', srtf_wait, SRTFScheduler)
-        
-        # Round Robin: Depends on quantum
-        quantum = max(self.MIN_TIME_QUANTUM, int(avg_burst / self.QUANTUM_DIVISOR))
+        scales = self._estimate_scales(analysis)
+        divisors = self.wait_divisors
+        waits = {name: base / divisors[name] * adjustment
+                 for name, (base, adjustment) in scales.items()}
+        
+        # Round Robin quantum depends on the average burst
+        quantum = max(self.MIN_TIME_QUANTUM,
+                      int(analysis.avg_burst_time / self.QUANTUM_DIVISOR))
         quantum = min(quantum, self.MAX_TIME_QUANTUM)
-        rr_wait = avg_burst * n / 2
-        # RR is better for interactive (I/O-bound) workloads
-        if analysis.io_bound_ratio > 0.3:
-            rr_wait *= 0.8
-        # Use default value to avoid closure issue
-        estimates['RR'] = PerformanceEstimate(f'RR (q={quantum})', rr_wait, 
-                                               lambda q=quantum: RoundRobinScheduler(q))
-        
-        # Priority: Depends on priority distribution
-        priority_wait = avg_burst * (n - 1) / 3
-        # Worse if priorities are similar (less meaningful ordering)
-        if analysis.priority_variance < 3:
-            priority_wait *= 1.3
-        estimates['Priority'] = PerformanceEstimate('Priority', priority_wait, PriorityScheduler)
         
-        # Preemptive Priority: Better with high I/O ratio
-        preemptive_priority_wait = avg_burst * (n - 1) / 4
-        if analysis.io_bound_ratio > 0.3:
-            preemptive_priority_wait *= 0.9
-        estimates['PreemptivePriority'] = PerformanceEstimate('Preemptive Priority', 
-                                                               preemptive_priority_wait,
-                                                               PreemptivePriorityScheduler)
-        
-        # MLFQ: Good for mixed workloads with many processes
-        mlfq_wait = avg_burst * n / 3
-        if n > 10:
-            mlfq_wait *= 0.9  # Scales better with many processes
-        estimates['MLFQ'] = PerformanceEstimate('MLFQ', mlfq_wait, MLFQScheduler)
+        return {
+            'FCFS': PerformanceEstimate('FCFS', waits['FCFS'], FCFSScheduler,
+                                        AlgoKind.FCFS),
+            'SJF': PerformanceEstimate('SJF', waits['SJF'], SJFScheduler,
+                                       AlgoKind.SJF),
+            'SRTF': PerformanceEstimate('SRTF', waits['SRTF'], SRTFScheduler,
+                                        AlgoKind.SRTF),
+            'RR': PerformanceEstimate(f'RR (q={quantum})', waits['RR'],
+                                      partial(RoundRobinScheduler, quantum),
+                                      AlgoKind.RR),
+            'Priority': PerformanceEstimate('Priority', waits['Priority'],
+                                            PriorityScheduler, AlgoKind.PRIORITY),
+            'PreemptivePriority': PerformanceEstimate('Preemptive Priority',
+                                                      waits['PreemptivePriority'],
+                                                      PreemptivePriorityScheduler,
+                                                      AlgoKind.PREEMPTIVE_PRIORITY),
+            'MLFQ': PerformanceEstimate('MLFQ', waits['MLFQ'], MLFQScheduler,
+                                        AlgoKind.MLFQ),
+        }
+    
+    def learn_from_results(self, analysis: WorkloadAnalysis,
+                           results: List[Tuple[str, SchedulingResult]]) -> None:
+        """Move the wait divisors towards the observed waiting times.
         
-        return estimates
+        Each divisor is updated as an exponentially weighted moving
+        average with weight LEARNING_RATE on the new observation.
+        """
+        scales = self._estimate_scales(analysis)
+        rate = self.LEARNING_RATE
+        divisors = self.wait_divisors
+        for name, result in results:
+            base, adjustment = scales.get(name, (0, 0))
+            if result.avg_waiting_time > 0 and base * adjustment > 0:
+                observed = base * adjustment / result.avg_waiting_time
+                divisors[name] += rate * (observed - divisors[name])
     
     def select_scheduler(self, processes: List[Process]) -> SchedulerRecommendation:
         """Select the best scheduling algorithm based on workload analysis.
@@ -203,79 +360,41 @@ class AdaptiveSelector:
         # Handle empty process list
         if analysis.process_count == 0:
             return SchedulerRecommendation(
-                scheduler=FCFSScheduler(),
+                scheduler_factory=FCFSScheduler,
                 algorithm_name="FCFS",
-                justification="No processes to schedule. FCFS selected as default.",
+                justification_factory=lambda: "No processes to schedule. FCFS selected as default.",
                 expected_avg_wait=0,
                 confidence=1.0
             )
         
         # Step 1: Calculate performance estimates for all algorithms
-        estimates = self._estimate_performance(processes, analysis)
+        estimates = self._estimate_performance(analysis)
         
-        # Step 2: Sort by estimated wait time (ascending)
-        sorted_estimates = sorted(estimates.values(), 
-                                  key=lambda x: x.estimated_wait_time)
+        # Step 2: Rank by estimated wait time (ascending); only the top 3
+        # matter for selection, the full ranking is left to _justify
         
-        # Get top 3 algorithms
-        top_3 = sorted_estimates[:3]
-        top_3_keys = set()
-        for e in top_3:
-            if 'Priority' in e.algorithm and 'Preemptive' in e.algorithm:
-                top_3_keys.add('PreemptivePriority')
-            elif 'Priority' in e.algorithm:
-                top_3_keys.add('Priority')
-            elif 'RR' in e.algorithm:
-                top_3_keys.add('RR')
-            else:
-                top_3_keys.add(e.algorithm)
-        
-        # Step 3: Select from top 3 based on workload type
-        selected = top_3[0]  # Default to best performer
-        
-        # Step 4: Only use Priority scheduling if it's in top 3 AND meets criteria
+        # Step 3: Select from top 3 based on workload type, defaulting to
+        # the best performer. Priority scheduling is only used if it is in
+        # the top 3 AND the priorities are spread out enough to matter.
+        top_3 = heapq.nsmallest(3, estimates.values(), key=_estimated_wait)
         priority_criteria_met = (analysis.priority_variance > self.PRIORITY_VARIANCE_THRESHOLD and 
                                   analysis.priority_range > self.PRIORITY_RANGE_THRESHOLD)
+        io_ratio = analysis.io_bound_ratio
+        tiers = _PREFERENCE_TABLE[priority_criteria_met, io_ratio > 0.3,
+                                  analysis.is_interactive or io_ratio > 0.5]
         
-        # Check if Priority (non-preemptive) is in top 3
-        priority_in_top_3 = 'Priority' in top_3_keys
-        preemptive_priority_in_top_3 = 'PreemptivePriority' in top_3_keys
-        
-        if priority_criteria_met:
-            if preemptive_priority_in_top_3 and analysis.io_bound_ratio > 0.3:
-                selected = estimates['PreemptivePriority']
-            elif priority_in_top_3:
-                selected = estimates['Priority']
-            # If neither is in top 3, use best performer (already selected)
-        else:
-            # Select based on workload type from top 3
-            if analysis.is_interactive:
-                # Prefer RR or MLFQ for interactive workloads
-                for e in top_3:
-                    if 'RR' in e.algorithm or 'MLFQ' in e.algorithm:
-                        selected = e
-                        break
-            elif analysis.io_bound_ratio > 0.5:
-                # High I/O: prefer RR or MLFQ
-                for e in top_3:
-                    if 'RR' in e.algorithm or 'MLFQ' in e.algorithm:
-                        selected = e
-                        break
-            # Otherwise, use the best performer (already selected)
-        
-        # Build performance estimates string for justification
-        estimates_str = self._format_performance_estimates(sorted_estimates, selected.algorithm)
-        
-        # Create scheduler instance - all scheduler_class values are callable
-        scheduler = selected.scheduler_class()
-        
-        # Build justification
-        justification = self._build_justification(selected, analysis, estimates_str)
+        selected = top_3[0]
+        for tier in tiers:
+            match = next((e for e in top_3 if e.kind in tier), None)
+            if match is not None:
+                selected = match
+                break
         
         return SchedulerRecommendation(
-            scheduler=scheduler,
+            scheduler_factory=selected.scheduler_class,
             algorithm_name=selected.algorithm,
-            justification=justification,
+            justification_factory=partial(self._justify, selected, analysis,
+                                          estimates),
             expected_avg_wait=selected.estimated_wait_time,
             confidence=0.85
         )
@@ -291,20 +410,27 @@ class AdaptiveSelector:
             lines.append(f"  {est.algorithm:25s} {est.estimated_wait_time:>8.0f}ms {marker}")
         return "\n".join(lines)
     
+    def _justify(self, selected: PerformanceEstimate, analysis: WorkloadAnalysis,
+                 estimates: Dict[str, PerformanceEstimate]) -> str:
+        """Rank and format the estimates and build the justification."""
+        sorted_estimates = sorted(estimates.values(), key=_estimated_wait)
+        estimates_str = self._format_performance_estimates(sorted_estimates, selected.algorithm)
+        return self._build_justification(selected, analysis, estimates_str)
+    
     def _build_justification(self, selected: PerformanceEstimate,
                              analysis: WorkloadAnalysis,
                              estimates_str: str) -> str:
         """Build detailed justification string."""
-        algo_name = selected.algorithm.split()[0]  # Remove quantum info if present
+        kind = selected.kind
         
         reason = ""
-        if algo_name in ('SRTF', 'SJF'):
-            reason = f"{algo_name} provides lowest estimated waiting time for this workload."
-        elif 'RR' in algo_name:
+        if kind is AlgoKind.SRTF or kind is AlgoKind.SJF:
+            reason = f"{kind.name} provides lowest estimated waiting time for this workload."
+        elif kind is AlgoKind.RR:
             reason = f"Round Robin provides fair CPU distribution for {analysis.process_count} processes."
-        elif 'MLFQ' in algo_name:
+        elif kind is AlgoKind.MLFQ:
             reason = "MLFQ adapts to process behavior, balancing interactive and batch workloads."
-        elif 'Priority' in algo_name:
+        elif kind is AlgoKind.PRIORITY:
             reason = f"Priority scheduling is effective with high priority variance (range={analysis.priority_range})."
         else:
             reason = f"FCFS provides simplicity with minimal overhead."
@@ -318,23 +444,37 @@ class AdaptiveSelector:
             f"Justification: {reason}"
         )
     
-    def compare_all(self, processes: List[Process]) -> List[Tuple[str, SchedulingResult]]:
-        """Run all scheduling algorithms and return results for comparison."""
-        results = []
+    def _compare_factories(self) -> List[Tuple[str, Callable[[], BaseScheduler]]]:
+        """(name, zero-argument factory) for every scheduler in self.schedulers."""
+        return [(name, partial(scheduler_class, time_quantum=20) if name == 'RR'
+                 else scheduler_class)
+                for name, scheduler_class in self.schedulers.items()]
+    
+    def compare_all(self, processes: List[Process], workers: int = 1,
+                    learn: bool = False) -> List[Tuple[str, SchedulingResult]]:
+        """Run all scheduling algorithms and return results for comparison.
         
-        for name, scheduler_class in self.schedulers.items():
-            # Reset processes for each scheduler
-            for p in processes:
-                p.reset()
-            
-            # Create scheduler instance
-            if name == 'RR':
-                scheduler = scheduler_class(time_quantum=20)
-            else:
-                scheduler = scheduler_class()
-            
-            # Run scheduling
-            result = scheduler.schedule(processes)
-            results.append((name, result))
+        Args:
+            processes: List of processes to schedule
+            workers: Number of worker processes; with more than one, the
+                algorithms run in parallel on pickled copies of the
+                processes and the given list is left untouched
+            learn: Feed the observed waiting times back into the wait
+                divisors used by select_scheduler
+        """
+        compared = self._compare_factories()
+        if workers > 1:
+            names = [name for name, _ in compared]
+            factories = [factory for _, factory in compared]
+            with ProcessPoolExecutor(max_workers=min(workers, len(factories))) as pool:
+                runs = pool.map(_run_scheduler, factories, repeat(processes))
+                results = list(zip(names, runs))
+        else:
+            # Every scheduler resets the processes at the start of schedule()
+            results = [(name, _run_scheduler(factory, processes))
+                       for name, factory in compared]
+        
+        if learn and processes:
+            self.learn_from_results(self.analyze_workload(processes), results)
         
         return results
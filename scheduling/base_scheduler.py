@@ -1,12 +1,23 @@
 """Base scheduler abstract class for OS simulation."""
 
+import heapq
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
+from itertools import count
+from operator import attrgetter
 from typing import List, Tuple, Optional, Dict
 from models.process import Process, ProcessState
 
 
-@dataclass
+# Sort key for arrival order, shared by the schedulers
+ARRIVAL_KEY = attrgetter('arrival_time', 'pid')
+
+# Per-process input fields extracted into parallel columns by _to_soa
+_SOA_FIELDS = ('pid', 'arrival', 'burst', 'priority')
+_soa_row = attrgetter('pid', 'arrival_time', 'burst_time', 'priority')
+
+
+@dataclass(slots=True)
 class SchedulingResult:
     """Result of a scheduling simulation."""
     algorithm: str
@@ -29,10 +40,16 @@ class SchedulingResult:
             return
         
         n = len(self.processes)
-        total_waiting = sum(p.waiting_time for p in self.processes)
-        total_turnaround = sum(p.turnaround_time for p in self.processes)
-        total_response = sum(p.response_time for p in self.processes if p.response_time >= 0)
-        total_completion = sum(p.completion_time for p in self.processes)
+        # Accumulate every total in a single pass over the processes
+        total_waiting = total_turnaround = total_response = 0
+        total_completion = busy_time = 0
+        for p in self.processes:
+            total_waiting += p.waiting_time
+            total_turnaround += p.turnaround_time
+            if p.response_time >= 0:
+                total_response += p.response_time
+            total_completion += p.completion_time
+            busy_time += p.burst_time
         
         self.avg_waiting_time = total_waiting / n
         self.avg_turnaround_time = total_turnaround / n
@@ -41,7 +58,6 @@ class SchedulingResult:
         
         # Calculate CPU utilization
         if self.total_time > 0:
-            busy_time = sum(p.burst_time for p in self.processes)
             self.cpu_utilization = (busy_time / self.total_time) * 100
             self.throughput = n / (self.total_time / 1000)  # processes per second
 
@@ -57,7 +73,11 @@ class BaseScheduler(ABC):
         self.gantt_chart: List[Tuple[int, int, int]] = []
         self.context_switches: int = 0
         self.running_process: Optional[Process] = None
-        self.logs: List[str] = []
+        # (time, message) pairs; formatted on demand by the logs property
+        self._log_entries: List[Tuple[int, str]] = []
+        # Set to False to skip building log messages, e.g. when only the
+        # metrics of a run are needed
+        self.logging_enabled: bool = True
     
     @abstractmethod
     def schedule(self, processes: List[Process]) -> SchedulingResult:
@@ -84,7 +104,8 @@ class BaseScheduler(ABC):
         """Add a process to the ready queue."""
         process.state = ProcessState.READY
         self.ready_queue.append(process)
-        self.log(f"Process P{process.pid} added to ready queue")
+        if self.logging_enabled:
+            self.log(f"Process P{process.pid} added to ready queue")
     
     def remove_from_ready_queue(self, process: Process) -> None:
         """Remove a process from the ready queue."""
@@ -93,20 +114,41 @@ class BaseScheduler(ABC):
     
     def get_arrived_processes(self, processes: List[Process], time: int) -> List[Process]:
         """Get processes that have arrived by the given time."""
-        return [p for p in processes if p.arrival_time <= time and p.state == ProcessState.NEW]
+        new = ProcessState.NEW
+        return [p for p in processes if p.arrival_time <= time and p.state is new]
+    
+    def _to_soa(self, processes: List[Process]) -> Tuple[List[Process], Dict[str, Tuple[int, ...]]]:
+        """Split processes into parallel per-field columns.
+        
+        Returns the processes sorted by (arrival_time, pid) together with
+        their pid, arrival, burst and priority values as tuples in that
+        same order, so simulation loops can index plain sequences instead
+        of loading attributes from each Process.
+        """
+        order = sorted(processes, key=ARRIVAL_KEY)
+        rows = zip(*map(_soa_row, order)) if order else ((),) * len(_SOA_FIELDS)
+        return order, dict(zip(_SOA_FIELDS, rows))
     
     def reset(self) -> None:
         """Reset the scheduler state."""
         self.ready_queue.clear()
         self.current_time = 0
-        self.gantt_chart.clear()
+        # Rebind rather than clear: the previous list belongs to the last result
+        self.gantt_chart = []
         self.context_switches = 0
         self.running_process = None
-        self.logs.clear()
+        self._log_entries.clear()
     
     def log(self, message: str) -> None:
         """Add a log message with timestamp."""
-        self.logs.append(f"[{self.current_time:05d}ms] {message}")
+        if not self.logging_enabled:
+            return
+        self._log_entries.append((self.current_time, message))
+    
+    @property
+    def logs(self) -> List[str]:
+        """Log messages formatted with their timestamps."""
+        return [f"[{time:05d}ms] {message}" for time, message in self._log_entries]
     
     def calculate_process_metrics(self, process: Process) -> None:
         """Calculate metrics for a completed process."""
@@ -118,7 +160,7 @@ class BaseScheduler(ABC):
         result = SchedulingResult(
             algorithm=self.name,
             processes=processes,
-            gantt_chart=self.gantt_chart.copy(),
+            gantt_chart=self.gantt_chart,
             context_switches=self.context_switches,
             total_time=self.current_time
         )
@@ -128,3 +170,51 @@ class BaseScheduler(ABC):
     def __repr__(self) -> str:
         mode = "Preemptive" if self.preemptive else "Non-Preemptive"
         return f"{self.name} ({mode})"
+
+
+class HeapScheduler(BaseScheduler):
+    """Base for schedulers whose ready queue is a binary heap.
+    
+    ready_queue holds (key..., sequence, process) entries; the sequence
+    number keeps equal keys in insertion order.
+    """
+    
+    def __init__(self, name: str, preemptive: bool = False):
+        super().__init__(name, preemptive)
+        self._sequence = count()
+    
+    @staticmethod
+    @abstractmethod
+    def _ready_key(process: Process) -> Tuple:
+        """Heap key for a process; smaller runs first."""
+    
+    def _push(self, process: Process) -> None:
+        """Insert a process into the ready heap."""
+        heapq.heappush(self.ready_queue,
+                       (*self._ready_key(process), next(self._sequence), process))
+    
+    def add_to_ready_queue(self, process: Process) -> None:
+        """Add a process to the ready queue."""
+        process.state = ProcessState.READY
+        self._push(process)
+        if self.logging_enabled:
+            self.log(f"Process P{process.pid} added to ready queue")
+    
+    def remove_from_ready_queue(self, process: Process) -> None:
+        """Remove a process from the ready queue."""
+        queue = self.ready_queue
+        if queue and queue[0][-1] is process:
+            heapq.heappop(queue)
+            return
+        for i, entry in enumerate(queue):
+            if entry[-1] is process:
+                queue[i] = queue[-1]
+                queue.pop()
+                heapq.heapify(queue)
+                return
+    
+    def select_next(self) -> Optional[Process]:
+        """Select the process at the top of the ready heap."""
+        if not self.ready_queue:
+            return None
+        return self.ready_queue[0][-1]
@@ -1,5 +1,6 @@
 """First-Come-First-Serve (FCFS) Scheduler."""
 
+from bisect import bisect_right
 from typing import List, Optional
 from .base_scheduler import BaseScheduler, SchedulingResult
 from models.process import Process, ProcessState
@@ -15,11 +16,13 @@ class FCFSScheduler(BaseScheduler):
         super().__init__("FCFS", preemptive=False)
     
     def select_next(self) -> Optional[Process]:
-        """Select the first process in the ready queue."""
+        """Select the first process in the ready queue.
+        
+        schedule() computes the schedule without a ready queue and leaves
+        it empty; this reflects processes added with add_to_ready_queue.
+        """
         if not self.ready_queue:
             return None
-        # FCFS: select the process that arrived first
-        self.ready_queue.sort(key=lambda p: (p.arrival_time, p.pid))
         return self.ready_queue[0]
     
     def schedule(self, processes: List[Process]) -> SchedulingResult:
@@ -30,60 +33,45 @@ class FCFSScheduler(BaseScheduler):
         for p in processes:
             p.reset()
         
-        # Sort by arrival time
-        remaining = sorted(processes.copy(), key=lambda p: (p.arrival_time, p.pid))
-        completed = []
+        # FCFS runs processes in arrival order, so the simulation reduces
+        # to one scan: each process starts at max(previous completion,
+        # its arrival). Arrivals are still logged as the clock reaches them.
+        order, columns = self._to_soa(processes)
+        pids, arrival, burst = columns['pid'], columns['arrival'], columns['burst']
+        n = len(order)
+        next_arrival = 0
         
-        while remaining or self.ready_queue:
-            # Add arrived processes to ready queue
-            while remaining and remaining[0].arrival_time <= self.current_time:
-                process = remaining.pop(0)
-                self.add_to_ready_queue(process)
-            
-            # If no process is ready, jump to next arrival
-            if not self.ready_queue:
-                if remaining:
-                    self.current_time = remaining[0].arrival_time
-                    continue
-                else:
-                    break
-            
-            # Select next process (first in queue)
-            process = self.select_next()
-            if not process:
-                break
+        for i, process in enumerate(order):
+            # CPU idles until the next process arrives
+            if arrival[i] > self.current_time:
+                self.current_time = arrival[i]
             
-            self.remove_from_ready_queue(process)
-            
-            # Record response time (first time process starts running)
-            if process.response_time == -1:
-                process.response_time = self.current_time - process.arrival_time
-            
-            # Set process as running
-            process.state = ProcessState.RUNNING
-            process.start_time = self.current_time
-            self.running_process = process
-            self.log(f"Process P{process.pid} started executing")
+            # Add arrived processes to ready queue
+            if next_arrival < n and arrival[next_arrival] <= self.current_time:
+                arrived = bisect_right(arrival, self.current_time, next_arrival)
+                if self.logging_enabled:
+                    for j in range(next_arrival, arrived):
+                        self.log(f"Process P{pids[j]} added to ready queue")
+                next_arrival = arrived
             
-            # Execute for full burst time (non-preemptive)
             start_time = self.current_time
-            self.current_time += process.burst_time
-            process.remaining_time = 0
+            if self.logging_enabled:
+                self.log(f"Process P{pids[i]} started executing")
             
-            # Record in Gantt chart
-            self.gantt_chart.append((process.pid, start_time, self.current_time))
+            # Execute for full burst time (non-preemptive)
+            self.current_time += burst[i]
+            self.gantt_chart.append((pids[i], start_time, self.current_time))
+            if self.logging_enabled:
+                self.log(f"Process P{pids[i]} completed")
             
-            # Process completed
+            process.start_time = start_time
+            process.response_time = start_time - arrival[i]
+            process.remaining_time = 0
             process.completion_time = self.current_time
             process.state = ProcessState.TERMINATED
             self.calculate_process_metrics(process)
-            completed.append(process)
-            self.log(f"Process P{process.pid} completed")
-            
-            # Context switch (if there are more processes)
-            if remaining or self.ready_queue:
-                self.context_switches += 1
-            
-            self.running_process = None
+        
+        # A context switch follows every process except the last
+        self.context_switches = max(n - 1, 0)
         
         return self.create_result(processes)
@@ -2,7 +2,7 @@
 
 from typing import List, Optional, Deque
 from collections import deque
-from .base_scheduler import BaseScheduler, SchedulingResult
+from .base_scheduler import ARRIVAL_KEY, BaseScheduler, SchedulingResult
 from models.process import Process, ProcessState
 
 
@@ -48,7 +48,8 @@ class MLFQScheduler(BaseScheduler):
         process.queue_level = level
         process.state = ProcessState.READY
         self.queues[level].append(process)
-        self.log(f"Process P{process.pid} added to queue level {level}")
+        if self.logging_enabled:
+            self.log(f"Process P{process.pid} added to queue level {level}")
     
     def remove_from_queue(self, process: Process) -> None:
         """Remove a process from its current queue."""
@@ -78,18 +79,25 @@ class MLFQScheduler(BaseScheduler):
             p.queue_level = 0
         
         # Sort by arrival time
-        remaining = sorted(processes.copy(), key=lambda p: (p.arrival_time, p.pid))
+        remaining = deque(sorted(processes, key=ARRIVAL_KEY))
         n = len(processes)
         completed_count = 0
         
+        # Hoist loop-invariant attributes into locals
+        queues = self.queues
+        time_quantums = self.time_quantums
+        lowest_level = self.num_levels - 1
+        boost_interval = self.boost_interval
+        add_to_queue = self.add_to_queue
+        gantt_chart = self.gantt_chart
+        
         while completed_count < n:
             # Add arrived processes to level 0 queue
             while remaining and remaining[0].arrival_time <= self.current_time:
-                process = remaining.pop(0)
-                self.add_to_queue(process, 0)
+                add_to_queue(remaining.popleft(), 0)
             
             # Priority boost check
-            if self.current_time - self.last_boost_time >= self.boost_interval:
+            if self.current_time - self.last_boost_time >= boost_interval:
                 self.priority_boost()
                 self.last_boost_time = self.current_time
             
@@ -103,7 +111,7 @@ class MLFQScheduler(BaseScheduler):
                     break
             
             # Select next process from highest priority queue
-            process = self.queues[current_level].popleft()
+            process = queues[current_level].popleft()
             
             # Record response time
             if process.response_time == -1:
@@ -114,21 +122,16 @@ class MLFQScheduler(BaseScheduler):
             self.running_process = process
             
             # Determine time quantum for this level
-            time_quantum = self.time_quantums[current_level]
+            time_quantum = time_quantums[current_level]
             if time_quantum == 0:  # FCFS for lowest level
                 time_quantum = process.remaining_time
             
             # Determine actual run time
             run_time = min(time_quantum, process.remaining_time)
             
-            # Check for arrivals or boost during execution
+            # Check for arrivals during execution
             next_arrival = remaining[0].arrival_time if remaining else float('inf')
-            next_boost = self.last_boost_time + self.boost_interval
-            
-            # Find next event
             potential_end = self.current_time + run_time
-            
-            # For simplicity, we'll run the full quantum unless completion
             start_time = self.current_time
             
             if next_arrival < potential_end and current_level > 0:
@@ -140,14 +143,14 @@ class MLFQScheduler(BaseScheduler):
             self.current_time += actual_run_time
             
             # Record in Gantt chart
-            self.gantt_chart.append((process.pid, start_time, self.current_time))
+            gantt_chart.append((process.pid, start_time, self.current_time))
             
-            self.log(f"Process P{process.pid} ran for {actual_run_time}ms at level {current_level}")
+            if self.logging_enabled:
+                self.log(f"Process P{process.pid} ran for {actual_run_time}ms at level {current_level}")
             
             # Add newly arrived processes
             while remaining and remaining[0].arrival_time <= self.current_time:
-                new_process = remaining.pop(0)
-                self.add_to_queue(new_process, 0)
+                add_to_queue(remaining.popleft(), 0)
             
             if process.remaining_time <= 0:
                 # Process completed
@@ -156,15 +159,17 @@ class MLFQScheduler(BaseScheduler):
                 process.state = ProcessState.TERMINATED
                 self.calculate_process_metrics(process)
                 completed_count += 1
-                self.log(f"Process P{process.pid} completed")
-            elif actual_run_time >= time_quantum and current_level < self.num_levels - 1:
+                if self.logging_enabled:
+                    self.log(f"Process P{process.pid} completed")
+            elif actual_run_time >= time_quantum and current_level < lowest_level:
                 # Used full quantum, demote to lower level
-                new_level = min(current_level + 1, self.num_levels - 1)
-                self.add_to_queue(process, new_level)
-                self.log(f"Process P{process.pid} demoted to level {new_level}")
+                new_level = min(current_level + 1, lowest_level)
+                add_to_queue(process, new_level)
+                if self.logging_enabled:
+                    self.log(f"Process P{process.pid} demoted to level {new_level}")
             else:
                 # Re-add to same level (yielded early or preempted)
-                self.add_to_queue(process, current_level)
+                add_to_queue(process, current_level)
             
             # Context switch
             self.context_switches += 1
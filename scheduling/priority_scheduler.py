@@ -1,11 +1,14 @@
 """Priority Scheduler (both Non-Preemptive and Preemptive with Aging)."""
 
-from typing import List, Optional
-from .base_scheduler import BaseScheduler, SchedulingResult
+import heapq
+from collections import deque
+from operator import attrgetter
+from typing import Dict, List, Tuple
+from .base_scheduler import ARRIVAL_KEY, HeapScheduler, SchedulingResult
 from models.process import Process, ProcessState
 
 
-class PriorityScheduler(BaseScheduler):
+class PriorityScheduler(HeapScheduler):
     """Non-preemptive Priority scheduling algorithm.
     
     Schedules processes based on priority (lower value = higher priority).
@@ -14,14 +17,9 @@ class PriorityScheduler(BaseScheduler):
     def __init__(self):
         super().__init__("Priority (Non-Preemptive)", preemptive=False)
     
-    def select_next(self) -> Optional[Process]:
-        """Select the highest priority process."""
-        if not self.ready_queue:
-            return None
-        # Priority: select process with lowest priority value (highest priority)
-        # Tie-breaker: earlier arrival time, then lower PID
-        self.ready_queue.sort(key=lambda p: (p.priority, p.arrival_time, p.pid))
-        return self.ready_queue[0]
+    # Priority: lowest priority value (highest priority) first
+    # Tie-breaker: earlier arrival time, then lower PID
+    _ready_key = staticmethod(attrgetter('priority', 'arrival_time', 'pid'))
     
     def schedule(self, processes: List[Process]) -> SchedulingResult:
         """Run Priority scheduling on the given processes."""
@@ -32,29 +30,29 @@ class PriorityScheduler(BaseScheduler):
             p.reset()
         
         # Sort by arrival time initially
-        remaining = sorted(processes.copy(), key=lambda p: (p.arrival_time, p.pid))
+        remaining = deque(sorted(processes, key=ARRIVAL_KEY))
         
-        while remaining or self.ready_queue:
+        # Bind hot methods and attributes to locals
+        ready_queue = self.ready_queue
+        add_to_ready_queue = self.add_to_ready_queue
+        calculate_process_metrics = self.calculate_process_metrics
+        gantt_append = self.gantt_chart.append
+        
+        while remaining or ready_queue:
             # Add arrived processes to ready queue
-            arrived = [p for p in remaining if p.arrival_time <= self.current_time]
-            for process in arrived:
-                remaining.remove(process)
-                self.add_to_ready_queue(process)
+            while remaining and remaining[0].arrival_time <= self.current_time:
+                add_to_ready_queue(remaining.popleft())
             
             # If no process is ready, jump to next arrival
-            if not self.ready_queue:
+            if not ready_queue:
                 if remaining:
                     self.current_time = remaining[0].arrival_time
                     continue
                 else:
                     break
             
-            # Select highest priority process
-            process = self.select_next()
-            if not process:
-                break
-            
-            self.remove_from_ready_queue(process)
+            # Select and dequeue the highest priority process (heap top)
+            process = heapq.heappop(ready_queue)[-1]
             
             # Record response time
             if process.response_time == -1:
@@ -64,7 +62,8 @@ class PriorityScheduler(BaseScheduler):
             process.state = ProcessState.RUNNING
             process.start_time = self.current_time
             self.running_process = process
-            self.log(f"Process P{process.pid} started (priority={process.priority})")
+            if self.logging_enabled:
+                self.log(f"Process P{process.pid} started (priority={process.priority})")
             
             # Execute for full burst time (non-preemptive)
             start_time = self.current_time
@@ -72,16 +71,17 @@ class PriorityScheduler(BaseScheduler):
             process.remaining_time = 0
             
             # Record in Gantt chart
-            self.gantt_chart.append((process.pid, start_time, self.current_time))
+            gantt_append((process.pid, start_time, self.current_time))
             
             # Process completed
             process.completion_time = self.current_time
             process.state = ProcessState.TERMINATED
-            self.calculate_process_metrics(process)
-            self.log(f"Process P{process.pid} completed")
+            calculate_process_metrics(process)
+            if self.logging_enabled:
+                self.log(f"Process P{process.pid} completed")
             
             # Context switch
-            if remaining or self.ready_queue:
+            if remaining or ready_queue:
                 self.context_switches += 1
             
             self.running_process = None
@@ -89,7 +89,7 @@ class PriorityScheduler(BaseScheduler):
         return self.create_result(processes)
 
 
-class PreemptivePriorityScheduler(BaseScheduler):
+class PreemptivePriorityScheduler(HeapScheduler):
     """Preemptive Priority scheduling with aging.
     
     Higher priority process can preempt lower priority.
@@ -100,24 +100,58 @@ class PreemptivePriorityScheduler(BaseScheduler):
         super().__init__("Priority (Preemptive with Aging)", preemptive=True)
         self.aging_interval = aging_interval  # Time interval for aging
         self.aging_amount = aging_amount  # Priority increase per aging interval
+        
+        # Total aging applied so far. Aging shifts every queued process by
+        # the same amount, so keys stored relative to this offset never
+        # need re-heaping.
+        self._aging_offset = 0
+        # _aging_offset at the time each queued process (by PID) entered
+        # the ready queue; its aging_counter is credited when it leaves
+        self._aging_basis: Dict[int, int] = {}
+    
+    def _ready_key(self, process: Process) -> Tuple:
+        # Effective priority (original - aging_counter), lower runs first;
+        # stored as effective priority + _aging_offset
+        return (process.priority - process.aging_counter + self._aging_offset,
+                process.arrival_time, process.pid)
+    
+    def reset(self) -> None:
+        """Reset the scheduler state."""
+        super().reset()
+        self._aging_offset = 0
+        self._aging_basis.clear()
+    
+    def _push(self, process: Process) -> None:
+        """Insert a process into the ready heap, recording its aging basis."""
+        self._aging_basis[process.pid] = self._aging_offset
+        super()._push(process)
     
-    def select_next(self) -> Optional[Process]:
-        """Select the highest priority process considering aging."""
-        if not self.ready_queue:
-            return None
-        # Calculate effective priority (original - aging_counter)
-        # Lower effective priority = higher actual priority
-        self.ready_queue.sort(
-            key=lambda p: (p.priority - p.aging_counter, p.arrival_time, p.pid)
-        )
-        return self.ready_queue[0]
+    def _settle_aging(self, process: Process) -> None:
+        """Credit a dequeued process with the aging applied while it waited."""
+        basis = self._aging_basis.pop(process.pid, None)
+        if basis is not None:
+            process.aging_counter += self._aging_offset - basis
+    
+    def remove_from_ready_queue(self, process: Process) -> None:
+        """Remove a process from the ready queue."""
+        super().remove_from_ready_queue(process)
+        self._settle_aging(process)
     
     def apply_aging(self) -> None:
-        """Apply aging to all waiting processes."""
-        for process in self.ready_queue:
-            process.aging_counter += self.aging_amount
-            if process.aging_counter > 0:
-                self.log(f"Process P{process.pid} aged (effective priority: {process.priority - process.aging_counter})")
+        """Apply aging to all waiting processes.
+        
+        Aging is O(1): waiting processes share _aging_offset, and each
+        one's aging_counter is brought up to date when it leaves the ready
+        queue. Only logging walks the queue.
+        """
+        self._aging_offset += self.aging_amount
+        if not self.logging_enabled:
+            return
+        for *_, process in self.ready_queue:
+            aging_counter = (process.aging_counter + self._aging_offset
+                             - self._aging_basis[process.pid])
+            if aging_counter > 0:
+                self.log(f"Process P{process.pid} aged (effective priority: {process.priority - aging_counter})")
     
     def schedule(self, processes: List[Process]) -> SchedulingResult:
         """Run Preemptive Priority scheduling with aging."""
@@ -127,60 +161,59 @@ class PreemptivePriorityScheduler(BaseScheduler):
         for p in processes:
             p.reset()
         
+        # Sort by arrival time so arrivals can be drained from the front
+        remaining = deque(sorted(processes, key=ARRIVAL_KEY))
         n = len(processes)
         completed_count = 0
         last_aging_time = 0
         
+        # Hoist loop-invariant attributes into locals
+        aging_interval = self.aging_interval
+        ready_queue = self.ready_queue
+        add_to_ready_queue = self.add_to_ready_queue
+        calculate_process_metrics = self.calculate_process_metrics
+        gantt_append = self.gantt_chart.append
+        
         while completed_count < n:
             # Add arrived processes to ready queue
-            for process in processes:
-                if (process.arrival_time <= self.current_time and 
-                    process.state == ProcessState.NEW):
-                    self.add_to_ready_queue(process)
+            while remaining and remaining[0].arrival_time <= self.current_time:
+                add_to_ready_queue(remaining.popleft())
             
             # Apply aging periodically
-            if self.current_time - last_aging_time >= self.aging_interval:
+            if self.current_time - last_aging_time >= aging_interval:
                 self.apply_aging()
                 last_aging_time = self.current_time
             
             # If no process is ready, jump to next arrival
-            if not self.ready_queue:
-                next_arrival = min(
-                    (p.arrival_time for p in processes if p.state == ProcessState.NEW),
-                    default=None
-                )
-                if next_arrival is not None:
-                    self.current_time = next_arrival
+            if not ready_queue:
+                if remaining:
+                    self.current_time = remaining[0].arrival_time
                     continue
                 else:
                     break
             
-            # Select highest priority process
-            process = self.select_next()
-            if not process:
-                break
+            # Select highest priority process (heap top)
+            process = ready_queue[0][-1]
             
             # Record response time
             if process.response_time == -1:
                 process.response_time = self.current_time - process.arrival_time
             
             # Check for preemption
-            if self.running_process != process:
+            if self.running_process is not process:
                 if self.running_process is not None:
-                    self.log(f"Process P{self.running_process.pid} preempted by P{process.pid}")
+                    if self.logging_enabled:
+                        self.log(f"Process P{self.running_process.pid} preempted by P{process.pid}")
                     self.context_switches += 1
                 
                 process.state = ProcessState.RUNNING
                 self.running_process = process
-                self.remove_from_ready_queue(process)
+                heapq.heappop(ready_queue)
+                self._settle_aging(process)
             
             # Find next event time
-            next_arrival = min(
-                (p.arrival_time for p in processes 
-                 if p.state == ProcessState.NEW and p.arrival_time > self.current_time),
-                default=float('inf')
-            )
-            next_aging = last_aging_time + self.aging_interval
+            next_arrival = remaining[0].arrival_time if remaining else float('inf')
+            next_aging = last_aging_time + aging_interval
             completion_time = self.current_time + process.remaining_time
             
             next_event = min(next_arrival, next_aging, completion_time)
@@ -192,21 +225,22 @@ class PreemptivePriorityScheduler(BaseScheduler):
             
             # Record in Gantt chart
             if run_time > 0:
-                self.gantt_chart.append((process.pid, start_time, self.current_time))
+                gantt_append((process.pid, start_time, self.current_time))
             
             if process.remaining_time <= 0:
                 # Process completed
                 process.remaining_time = 0
                 process.completion_time = self.current_time
                 process.state = ProcessState.TERMINATED
-                self.calculate_process_metrics(process)
+                calculate_process_metrics(process)
                 completed_count += 1
-                self.log(f"Process P{process.pid} completed")
+                if self.logging_enabled:
+                    self.log(f"Process P{process.pid} completed")
                 self.running_process = None
             elif next_event == next_arrival or next_event == next_aging:
                 # Put back in ready queue for re-evaluation
                 process.state = ProcessState.READY
-                self.ready_queue.append(process)
+                self._push(process)
                 self.running_process = None
         
         return self.create_result(processes)
@@ -1,5 +1,6 @@
 """Round Robin Scheduler."""
 
+from bisect import bisect_right
 from typing import List, Optional
 from collections import deque
 from .base_scheduler import BaseScheduler, SchedulingResult
@@ -15,92 +16,108 @@ class RoundRobinScheduler(BaseScheduler):
     def __init__(self, time_quantum: int = 10):
         super().__init__(f"Round Robin (q={time_quantum})", preemptive=True)
         self.time_quantum = time_quantum
-        self.circular_queue: deque = deque()
     
     def select_next(self) -> Optional[Process]:
-        """Select the next process from the circular queue."""
-        if not self.circular_queue:
+        """Select the process at the front of the ready queue.
+        
+        schedule() runs on its own queue of indices and leaves the ready
+        queue empty; this reflects processes added with add_to_ready_queue.
+        """
+        if not self.ready_queue:
             return None
-        return self.circular_queue[0]
+        return self.ready_queue[0]
     
     def schedule(self, processes: List[Process]) -> SchedulingResult:
         """Run Round Robin scheduling on the given processes."""
         self.reset()
-        self.circular_queue.clear()
         
         # Reset all processes
         for p in processes:
             p.reset()
         
-        # Sort by arrival time
-        remaining = sorted(processes.copy(), key=lambda p: (p.arrival_time, p.pid))
-        n = len(processes)
+        # Simulate on per-field columns with a queue of indices; the
+        # Process objects are filled in once the simulation is done
+        order, columns = self._to_soa(processes)
+        pids, arrival = columns['pid'], columns['arrival']
+        n = len(order)
+        left = list(columns['burst'])
+        response = [-1] * n
+        completion = [0] * n
+        queue: deque = deque()
+        quantum = self.time_quantum
+        next_arrival = 0
         completed_count = 0
         
         while completed_count < n:
             # Add arrived processes to circular queue
-            while remaining and remaining[0].arrival_time <= self.current_time:
-                process = remaining.pop(0)
-                process.state = ProcessState.READY
-                self.circular_queue.append(process)
-                self.log(f"Process P{process.pid} added to queue")
+            if next_arrival < n and arrival[next_arrival] <= self.current_time:
+                arrived = bisect_right(arrival, self.current_time, next_arrival)
+                queue.extend(range(next_arrival, arrived))
+                if self.logging_enabled:
+                    for j in range(next_arrival, arrived):
+                        self.log(f"Process P{pids[j]} added to queue")
+                next_arrival = arrived
             
             # If no process is ready, jump to next arrival
-            if not self.circular_queue:
-                if remaining:
-                    self.current_time = remaining[0].arrival_time
+            if not queue:
+                if next_arrival < n:
+                    self.current_time = arrival[next_arrival]
                     continue
                 else:
                     break
             
             # Select next process from front of queue
-            process = self.circular_queue.popleft()
+            i = queue.popleft()
             
             # Record response time
-            if process.response_time == -1:
-                process.response_time = self.current_time - process.arrival_time
-            
-            # Set process as running
-            process.state = ProcessState.RUNNING
-            self.running_process = process
+            if response[i] == -1:
+                response[i] = self.current_time - arrival[i]
             
             # Determine run time (minimum of quantum and remaining time)
-            run_time = min(self.time_quantum, process.remaining_time)
+            run_time = min(quantum, left[i])
             start_time = self.current_time
             
-            self.log(f"Process P{process.pid} running for {run_time}ms")
+            if self.logging_enabled:
+                self.log(f"Process P{pids[i]} running for {run_time}ms")
             
             # Execute for run_time
-            process.remaining_time -= run_time
+            left[i] -= run_time
             self.current_time += run_time
             
             # Record in Gantt chart
-            self.gantt_chart.append((process.pid, start_time, self.current_time))
+            self.gantt_chart.append((pids[i], start_time, self.current_time))
             
             # Add newly arrived processes to queue (before re-adding current if not complete)
-            while remaining and remaining[0].arrival_time <= self.current_time:
-                new_process = remaining.pop(0)
-                new_process.state = ProcessState.READY
-                self.circular_queue.append(new_process)
-                self.log(f"Process P{new_process.pid} added to queue")
+            if next_arrival < n and arrival[next_arrival] <= self.current_time:
+                arrived = bisect_right(arrival, self.current_time, next_arrival)
+                queue.extend(range(next_arrival, arrived))
+                if self.logging_enabled:
+                    for j in range(next_arrival, arrived):
+                        self.log(f"Process P{pids[j]} added to queue")
+                next_arrival = arrived
             
-            if process.remaining_time > 0:
+            if left[i] > 0:
                 # Process not complete, add to back of queue
-                process.state = ProcessState.READY
-                self.circular_queue.append(process)
-                self.log(f"Process P{process.pid} quantum expired, re-queued")
+                queue.append(i)
+                if self.logging_enabled:
+                    self.log(f"Process P{pids[i]} quantum expired, re-queued")
             else:
                 # Process completed
-                process.completion_time = self.current_time
-                process.state = ProcessState.TERMINATED
-                self.calculate_process_metrics(process)
+                completion[i] = self.current_time
                 completed_count += 1
-                self.log(f"Process P{process.pid} completed")
+                if self.logging_enabled:
+                    self.log(f"Process P{pids[i]} completed")
             
             # Context switch
-            if self.circular_queue or remaining:
+            if queue or next_arrival < n:
                 self.context_switches += 1
-            
-            self.running_process = None
+        
+        # Write the results back to the processes
+        for i, process in enumerate(order):
+            process.remaining_time = left[i]
+            process.response_time = response[i]
+            process.completion_time = completion[i]
+            process.state = ProcessState.TERMINATED
+            self.calculate_process_metrics(process)
         
         return self.create_result(processes)
@@ -1,11 +1,14 @@
 """Shortest Job First (SJF) Scheduler."""
 
-from typing import List, Optional
-from .base_scheduler import BaseScheduler, SchedulingResult
+import heapq
+from collections import deque
+from operator import attrgetter
+from typing import List
+from .base_scheduler import ARRIVAL_KEY, HeapScheduler, SchedulingResult
 from models.process import Process, ProcessState
 
 
-class SJFScheduler(BaseScheduler):
+class SJFScheduler(HeapScheduler):
     """Shortest Job First scheduling algorithm.
     
     Non-preemptive algorithm that schedules the process with shortest burst time.
@@ -14,14 +17,9 @@ class SJFScheduler(BaseScheduler):
     def __init__(self):
         super().__init__("SJF", preemptive=False)
     
-    def select_next(self) -> Optional[Process]:
-        """Select the process with shortest burst time."""
-        if not self.ready_queue:
-            return None
-        # SJF: select process with shortest burst time
-        # Tie-breaker: earlier arrival time, then lower PID
-        self.ready_queue.sort(key=lambda p: (p.burst_time, p.arrival_time, p.pid))
-        return self.ready_queue[0]
+    # SJF: select process with shortest burst time
+    # Tie-breaker: earlier arrival time, then lower PID
+    _ready_key = staticmethod(attrgetter('burst_time', 'arrival_time', 'pid'))
     
     def schedule(self, processes: List[Process]) -> SchedulingResult:
         """Run SJF scheduling on the given processes."""
@@ -31,16 +29,13 @@ class SJFScheduler(BaseScheduler):
         for p in processes:
             p.reset()
         
-        # Sort by arrival time initially
-        remaining = sorted(processes.copy(), key=lambda p: (p.arrival_time, p.pid))
-        completed = []
+        # Sort by arrival time so arrivals can be drained from the front
+        remaining = deque(sorted(processes, key=ARRIVAL_KEY))
         
         while remaining or self.ready_queue:
             # Add arrived processes to ready queue
-            arrived = [p for p in remaining if p.arrival_time <= self.current_time]
-            for process in arrived:
-                remaining.remove(process)
-                self.add_to_ready_queue(process)
+            while remaining and remaining[0].arrival_time <= self.current_time:
+                self.add_to_ready_queue(remaining.popleft())
             
             # If no process is ready, jump to next arrival
             if not self.ready_queue:
@@ -50,12 +45,8 @@ class SJFScheduler(BaseScheduler):
                 else:
                     break
             
-            # Select next process (shortest burst time)
-            process = self.select_next()
-            if not process:
-                break
-            
-            self.remove_from_ready_queue(process)
+            # Select and dequeue the next process (shortest burst time)
+            process = heapq.heappop(self.ready_queue)[-1]
             
             # Record response time
             if process.response_time == -1:
@@ -65,7 +56,8 @@ class SJFScheduler(BaseScheduler):
             process.state = ProcessState.RUNNING
             process.start_time = self.current_time
             self.running_process = process
-            self.log(f"Process P{process.pid} started executing (burst={process.burst_time}ms)")
+            if self.logging_enabled:
+                self.log(f"Process P{process.pid} started executing (burst={process.burst_time}ms)")
             
             # Execute for full burst time (non-preemptive)
             start_time = self.current_time
@@ -79,8 +71,8 @@ class SJFScheduler(BaseScheduler):
             process.completion_time = self.current_time
             process.state = ProcessState.TERMINATED
             self.calculate_process_metrics(process)
-            completed.append(process)
-            self.log(f"Process P{process.pid} completed")
+            if self.logging_enabled:
+                self.log(f"Process P{process.pid} completed")
             
             # Context switch
             if remaining or self.ready_queue:
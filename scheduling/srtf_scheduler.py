@@ -1,11 +1,14 @@
 """Shortest Remaining Time First (SRTF) Scheduler."""
 
-from typing import List, Optional
-from .base_scheduler import BaseScheduler, SchedulingResult
+import heapq
+from collections import deque
+from operator import attrgetter
+from typing import List
+from .base_scheduler import ARRIVAL_KEY, HeapScheduler, SchedulingResult
 from models.process import Process, ProcessState
 
 
-class SRTFScheduler(BaseScheduler):
+class SRTFScheduler(HeapScheduler):
     """Shortest Remaining Time First scheduling algorithm.
     
     Preemptive version of SJF. Preempts running process if a new process
@@ -15,14 +18,11 @@ class SRTFScheduler(BaseScheduler):
     def __init__(self):
         super().__init__("SRTF", preemptive=True)
     
-    def select_next(self) -> Optional[Process]:
-        """Select the process with shortest remaining time."""
-        if not self.ready_queue:
-            return None
-        # SRTF: select process with shortest remaining time
-        # Tie-breaker: earlier arrival time, then lower PID
-        self.ready_queue.sort(key=lambda p: (p.remaining_time, p.arrival_time, p.pid))
-        return self.ready_queue[0]
+    # SRTF: select process with shortest remaining time
+    # Tie-breaker: earlier arrival time, then lower PID. A process's
+    # remaining time only changes while it runs, i.e. while it is out of
+    # the heap, so queued keys never go stale.
+    _ready_key = staticmethod(attrgetter('remaining_time', 'arrival_time', 'pid'))
     
     def schedule(self, processes: List[Process]) -> SchedulingResult:
         """Run SRTF scheduling on the given processes."""
@@ -32,90 +32,87 @@ class SRTFScheduler(BaseScheduler):
         for p in processes:
             p.reset()
         
+        # Sort by arrival time so arrivals can be drained from the front
+        remaining = deque(sorted(processes, key=ARRIVAL_KEY))
         n = len(processes)
         completed_count = 0
         
-        # Add all processes to consideration
-        all_processes = {p.pid: p for p in processes}
+        # Bind hot methods, attributes and states to locals
+        ready_queue = self.ready_queue
+        add_to_ready_queue = self.add_to_ready_queue
+        push = self._push
+        calculate_process_metrics = self.calculate_process_metrics
+        ready_key = self._ready_key
+        gantt_append = self.gantt_chart.append
+        READY, RUNNING, TERMINATED = ProcessState.READY, ProcessState.RUNNING, ProcessState.TERMINATED
         
         while completed_count < n:
             # Add arrived processes to ready queue
-            for process in processes:
-                if (process.arrival_time <= self.current_time and 
-                    process.state == ProcessState.NEW):
-                    self.add_to_ready_queue(process)
+            while remaining and remaining[0].arrival_time <= self.current_time:
+                add_to_ready_queue(remaining.popleft())
             
             # If no process is ready, jump to next arrival
-            if not self.ready_queue:
-                next_arrival = min(
-                    (p.arrival_time for p in processes if p.state == ProcessState.NEW),
-                    default=None
-                )
-                if next_arrival is not None:
-                    self.current_time = next_arrival
+            if not ready_queue:
+                if remaining:
+                    self.current_time = remaining[0].arrival_time
                     continue
                 else:
                     break
             
-            # Select process with shortest remaining time
-            process = self.select_next()
-            if not process:
-                break
+            # Select process with shortest remaining time (heap top)
+            process = ready_queue[0][-1]
             
             # Record response time
             if process.response_time == -1:
                 process.response_time = self.current_time - process.arrival_time
             
             # Set process as running
-            if self.running_process != process:
+            if self.running_process is not process:
                 if self.running_process is not None:
                     # Preemption occurred
-                    self.log(f"Process P{self.running_process.pid} preempted by P{process.pid}")
+                    if self.logging_enabled:
+                        self.log(f"Process P{self.running_process.pid} preempted by P{process.pid}")
                     self.context_switches += 1
                 
-                process.state = ProcessState.RUNNING
+                process.state = RUNNING
                 self.running_process = process
-                self.remove_from_ready_queue(process)
+                heapq.heappop(ready_queue)
             
-            # Find next event time (next arrival or completion)
-            next_arrival = min(
-                (p.arrival_time for p in processes 
-                 if p.state == ProcessState.NEW and p.arrival_time > self.current_time),
-                default=float('inf')
-            )
+            start_time = self.current_time
             
-            completion_time = self.current_time + process.remaining_time
-            
-            # Determine how long to run
-            if next_arrival < completion_time:
-                # Run until next arrival
-                run_time = next_arrival - self.current_time
-                start_time = self.current_time
-                process.remaining_time -= run_time
+            # Run through arrivals for as long as none of them is shorter
+            next_arrival = remaining[0].arrival_time if remaining else float('inf')
+            while next_arrival < self.current_time + process.remaining_time:
+                process.remaining_time -= next_arrival - self.current_time
                 self.current_time = next_arrival
-                
-                # Record in Gantt chart
-                self.gantt_chart.append((process.pid, start_time, self.current_time))
-                
-                # Put process back in ready queue for re-evaluation
-                process.state = ProcessState.READY
-                self.ready_queue.append(process)
-                self.running_process = None
+                while remaining and remaining[0].arrival_time <= next_arrival:
+                    add_to_ready_queue(remaining.popleft())
+                if ready_queue[0][:-2] < ready_key(process):
+                    break
+                next_arrival = remaining[0].arrival_time if remaining else float('inf')
             else:
                 # Run to completion
-                start_time = self.current_time
                 self.current_time += process.remaining_time
                 process.remaining_time = 0
                 
                 # Record in Gantt chart
-                self.gantt_chart.append((process.pid, start_time, self.current_time))
+                gantt_append((process.pid, start_time, self.current_time))
                 
                 # Process completed
                 process.completion_time = self.current_time
-                process.state = ProcessState.TERMINATED
-                self.calculate_process_metrics(process)
+                process.state = TERMINATED
+                calculate_process_metrics(process)
                 completed_count += 1
-                self.log(f"Process P{process.pid} completed")
+                if self.logging_enabled:
+                    self.log(f"Process P{process.pid} completed")
                 self.running_process = None
+                continue
+            
+            # A shorter process arrived: record the slice and put the
+            # process back in the ready queue
+            gantt_append((process.pid, start_time, self.current_time))
+            process.state = READY
+            push(process)
+            self.running_process = None
         
         return self.create_result(processes)
@@ -1,6 +1,7 @@
 """Critical Section simulation for OS simulation."""
 
-from typing import List, Callable, Any
+from typing import List, Callable, Any, Deque
+from collections import deque
 from dataclasses import dataclass, field
 import threading
 import time
@@ -33,10 +34,10 @@ class CriticalSection:
         start_time = time.time()
         
         if self.mutex.acquire(thread_id, blocking):
-            with self._lock:
-                self.in_section = True
-                self.current_thread = thread_id
-                self._log_event(thread_id, 'enter', "Entered critical section")
+            # Holding the mutex already makes this thread the only writer
+            self.in_section = True
+            self.current_thread = thread_id
+            self._log_event(thread_id, 'enter', "Entered critical section")
             return True
         else:
             self._log_event(thread_id, 'wait', "Waiting for critical section")
@@ -100,7 +101,7 @@ class ProducerConsumerProblem:
     
     def __init__(self, buffer_size: int = 5):
         self.buffer_size = buffer_size
-        self.buffer: List[Any] = []
+        self.buffer: Deque[Any] = deque()
         
         # Semaphores
         self.empty_count = threading.Semaphore(buffer_size)  # Empty slots
@@ -142,7 +143,7 @@ class ProducerConsumerProblem:
         with self.mutex:
             if not self.buffer:
                 return None
-            item = self.buffer.pop(0)
+            item = self.buffer.popleft()
             self.consumed_count += 1
             self._log(f"Consumer {consumer_id}: Consumed item {item} (buffer: {len(self.buffer)}/{self.buffer_size})")
         
@@ -23,25 +23,30 @@ class RaceConditionResult:
 class SharedCounter:
     """A shared counter for demonstrating race conditions."""
     
-    def __init__(self):
+    def __init__(self, race_window: float = 0.0001):
         self.value = 0
         self.mutex = threading.Lock()
         self.operations = 0
+        # Seconds to stall between read and write in increment_unsafe;
+        # widens the race window so lost updates actually show up
+        self.race_window = race_window
     
     def increment_unsafe(self) -> None:
         """Increment without synchronization (race condition)."""
         # Simulating read-modify-write with explicit steps
         current = self.value
         # Small delay to increase chance of race condition
-        time.sleep(0.0001)
+        if self.race_window:
+            time.sleep(self.race_window)
         self.value = current + 1
         self.operations += 1
     
     def increment_safe(self) -> None:
         """Increment with mutex protection (thread-safe)."""
+        # No stall here: the lock already excludes other writers, and
+        # sleeping while holding it would only serialize the threads
         with self.mutex:
             current = self.value
-            time.sleep(0.0001)
             self.value = current + 1
             self.operations += 1
     
@@ -58,12 +63,13 @@ class RaceConditionDemo:
         self.results: List[RaceConditionResult] = []
     
     def run_without_mutex(self, num_threads: int = 5, 
-                          increments: int = 1000) -> RaceConditionResult:
+                          increments: int = 1000,
+                          race_window: float = 0.0001) -> RaceConditionResult:
         """Run race condition demo WITHOUT mutex protection.
         
         This should demonstrate lost updates due to race conditions.
         """
-        counter = SharedCounter()
+        counter = SharedCounter(race_window)
         threads: List[threading.Thread] = []
         
         expected = num_threads * increments
@@ -71,8 +77,9 @@ class RaceConditionDemo:
         
         # Create worker threads
         def worker():
+            increment = counter.increment_unsafe
             for _ in range(increments):
-                counter.increment_unsafe()
+                increment()
         
         # Start threads
         for i in range(num_threads):
@@ -123,8 +130,9 @@ class RaceConditionDemo:
         
         # Create worker threads
         def worker():
+            increment = counter.increment_safe
             for _ in range(increments):
-                counter.increment_safe()
+                increment()
         
         # Start threads
         for i in range(num_threads):
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""Tests for the adaptive scheduler selector."""
+
+import sys
+import os
+import dataclasses
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+from models.process import Process
+from scheduling.adaptive_selector import AdaptiveSelector
+
+
+def _workload(burst: int):
+    return [Process(pid=i, name=f"P{i}", burst_time=burst + i, priority=i % 3,
+                    arrival_time=i * 5) for i in range(1, 5)]
+
+
+def test_cached_analysis_is_read_only():
+    """Shared analyses cannot be changed by one caller behind another's back."""
+    selector = AdaptiveSelector()
+    analysis = selector.analyze_workload(_workload(40))
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        analysis.avg_burst_time = 0
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        selector.analyze_workload([]).process_count = 3
+    assert selector.analyze_workload(_workload(40)) is analysis
+
+
+def test_analysis_cache_evicts_least_recently_used():
+    """A cache hit keeps the analysis from being evicted next."""
+    selector = AdaptiveSelector()
+    selector.ANALYSIS_CACHE_SIZE = 2
+    first = selector.analyze_workload(_workload(10))
+    selector.analyze_workload(_workload(20))
+    assert selector.analyze_workload(_workload(10)) is first
+    
+    selector.analyze_workload(_workload(30))  # Evicts the burst-20 workload
+    assert selector.analyze_workload(_workload(10)) is first
+    assert len(selector._analysis_cache) == 2
+
+
+def test_compare_all_runs_configured_schedulers():
+    """compare_all runs the schedulers listed in selector.schedulers, in order."""
+    selector = AdaptiveSelector()
+    names = [name for name, _ in selector.compare_all(_workload(30))]
+    assert names == list(selector.schedulers)
+    
+    del selector.schedulers['MLFQ']
+    results = dict(selector.compare_all(_workload(30)))
+    assert 'MLFQ' not in results
+    assert results['RR'].avg_waiting_time >= 0
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""Tests for deadlock detection, resolution and prevention."""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.resource import Resource, ResourceType
+from resources.rag import ResourceAllocationGraph
+from resources.deadlock_detector import DeadlockDetector, strongly_connected_components
+from resources.deadlock_resolver import DeadlockResolver
+from resources.resource_manager import ResourceManager
+
+
+def _resolver() -> DeadlockResolver:
+    rag = ResourceAllocationGraph()
+    return DeadlockResolver(ResourceManager.empty(), rag, DeadlockDetector(rag))
+
+
+def _overlapping_deadlocks():
+    """Two cycles sharing P5 (P1-P3-P5, P5-P9) and an independent P7-P8 cycle.
+    
+    P2 waits on the P7-P8 cycle without being part of it.
+    """
+    rm = ResourceManager.empty()
+    rag = ResourceAllocationGraph()
+    for rid in range(1, 8):
+        rm.add_resource(Resource(rid, f"R{rid}", ResourceType.DISK, 1))
+        rag.add_resource(rid)
+    for pid, rid in ((5, 4), (3, 2), (8, 6), (1, 1), (7, 7), (9, 3), (2, 5)):
+        assert rm.request(pid, rid)
+        rag.add_assignment_edge(rid, pid)
+    for pid, rid in ((1, 2), (3, 4), (5, 1), (8, 7), (7, 6), (5, 3), (9, 4), (2, 6)):
+        assert not rm.request(pid, rid)
+        rag.add_request_edge(pid, rid)
+    return rm, rag
+
+
+def test_detect_reports_first_cycle_in_edge_order():
+    """detect() walks the wait-for graph in request edge order."""
+    _, rag = _overlapping_deadlocks()
+    assert rag.get_wait_for_graph() == {1: [3], 3: [5], 5: [1, 9], 8: [7],
+                                        7: [8], 9: [5], 2: [8]}
+    
+    deadlock = DeadlockDetector(rag).detect()
+    assert deadlock.cycle == ["P1", "R2", "P3", "R4", "P5", "R1", "P1"]
+    assert sorted(deadlock.processes) == [1, 3, 5]
+    assert sorted(deadlock.resources) == [1, 2, 4]
+
+
+def test_resolve_all_victim_order():
+    """resolve_all terminates one victim per detection until none is left."""
+    rm, rag = _overlapping_deadlocks()
+    detector = DeadlockDetector(rag)
+    resolver = DeadlockResolver(rm, rag, detector)
+    resolver.set_process_priority(3, 2)
+    
+    results = resolver.resolve_all()
+    assert [(r.victim_pid, r.resources_released) for r in results] == [
+        (3, {2: 1}), (9, {3: 1}), (8, {6: 1})]
+    assert detector.detect() is None
+    assert rm.get_held_resources(8) == []
+
+
+def test_detect_all_sccs_reports_each_independent_deadlock():
+    """Each multi-process component is one deadlock; bystanders are left out."""
+    _, rag = _overlapping_deadlocks()
+    deadlocks = DeadlockDetector(rag).detect_all_sccs()
+    
+    assert sorted(sorted(d.processes) for d in deadlocks) == [[1, 3, 5], [7, 8]]
+    for deadlock in deadlocks:
+        # Each report is a closed cycle through its own processes
+        assert deadlock.cycle[0] == deadlock.cycle[-1]
+        assert {int(node[1:]) for node in deadlock.cycle if node[0] == "P"} == \
+            set(deadlock.processes)
+
+
+def test_strongly_connected_components_on_deep_chain():
+    """A wait chain far deeper than the recursion limit is handled iteratively."""
+    depth = sys.getrecursionlimit() * 5
+    graph = {pid: [pid + 1] for pid in range(depth)}
+    graph[depth] = [depth - 2]  # Closes a three-process cycle at the end
+    
+    components = strongly_connected_components(graph)
+    assert len(components) == depth - 1
+    assert sorted(components[0]) == [depth - 2, depth - 1, depth]
+    assert all(len(c) == 1 for c in components[1:])
+
+
+def test_resource_ordering():
+    """Requests must follow the ordering; unordered rids are accepted as before."""
+    resolver = _resolver()
+    ordering = resolver.apply_resource_ordering([30, -2, 10**9, 7])
+    assert ordering == {-2: 0, 7: 1, 30: 2, 10**9: 3}
+    
+    assert resolver.check_ordering_violation(1, 30, [7], ordering) is False
+    assert resolver.check_ordering_violation(1, 7, [30], ordering) is True
+    assert resolver.check_ordering_violation(1, -2, [10**9], ordering) is True
+    # Unordered request: never a violation; unordered held rid: order 0
+    assert resolver.check_ordering_violation(1, 99, [10**9], ordering) is False
+    assert resolver.check_ordering_violation(1, -2, [99], ordering) is True
+    
+    # Without an explicit ordering the last applied one is used
+    assert resolver.check_ordering_violation(1, 7, [30]) is True
+    ordering[30] = -1
+    assert resolver.check_ordering_violation(1, 7, [30]) is True
+    resolver.reset()
+    assert resolver.check_ordering_violation(1, 7, [30]) is False
+
+
+def _cycle_rag(*pids: int) -> ResourceAllocationGraph:
+    """RAG where each process holds its own resource and wants the next one's."""
+    rag = ResourceAllocationGraph()
+    for pid in pids:
+        rag.add_assignment_edge(pid, pid)
+    for pid, nxt in zip(pids, pids[1:] + pids[:1]):
+        rag.add_request_edge(pid, nxt)
+    return rag
+
+
+def test_detect_cache_follows_reassigned_rag():
+    """Swapping detector.rag directly does not return the old graph's cycle."""
+    first = _cycle_rag(1, 2)
+    second = _cycle_rag(3, 4)
+    assert first.generation == second.generation
+    
+    detector = DeadlockDetector(first)
+    assert detector.detect().cycle == ["P1", "R2", "P2", "R1", "P1"]
+    
+    detector.rag = second
+    assert detector.detect().cycle == ["P3", "R4", "P4", "R3", "P3"]
+    
+    detector.rag = ResourceAllocationGraph()
+    assert detector.detect() is None
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""Tests for the Resource Allocation Graph."""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from resources.rag import ResourceAllocationGraph, resource_node
+
+
+def test_remove_process_returns_held_instances():
+    """Removing a process frees the instances its assignment edges held."""
+    rag = ResourceAllocationGraph()
+    rag.add_resource(1, instances=3)
+    rag.add_resource(2, instances=1)
+    rag.add_assignment_edge(1, 10, count=2)
+    rag.add_assignment_edge(2, 10)
+    rag.add_assignment_edge(1, 11)
+    rag.add_request_edge(10, 2)
+    
+    rag.remove_process(10)
+    
+    assert rag.nodes[resource_node(1)].available_instances == 2
+    assert rag.nodes[resource_node(2)].available_instances == 1
+    assert rag.get_processes_holding_resource(1) == [11]
+    assert rag.get_request_edges() == []
+    assert rag.get_resources_held_by_process(10) == []
+
+
+def test_wait_for_graph_follows_edge_order():
+    """Wait-for targets are listed in assignment edge order, without duplicates."""
+    rag = ResourceAllocationGraph()
+    rag.add_resource(5, instances=3)
+    rag.add_resource(2, instances=2)
+    for pid in (30, 4, 17):
+        rag.add_assignment_edge(5, pid)
+    rag.add_assignment_edge(2, 9)
+    rag.add_assignment_edge(2, 4)
+    rag.add_request_edge(8, 5)
+    rag.add_request_edge(8, 2)
+    rag.add_request_edge(4, 5)
+    
+    assert rag.get_wait_for_graph() == {8: [30, 4, 17, 9], 4: [30, 17]}
+    
+    # Re-assigning moves the holder to the end, as a new edge would
+    rag.remove_assignment_edge(5, 30)
+    rag.add_assignment_edge(5, 30)
+    assert rag.get_wait_for_graph()[8] == [4, 17, 30, 9]
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""Tests for the Resource Manager."""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.resource import Resource, ResourceType
+from resources.rag import ResourceAllocationGraph
+from resources.deadlock_detector import DeadlockDetector
+from resources.deadlock_resolver import DeadlockResolver, ResolutionMethod
+from resources.resource_manager import ResourceManager
+
+
+def _assert_held_index_matches(rm: ResourceManager) -> None:
+    """The per-process holdings index agrees with every resource's allocations."""
+    holders = {pid for r in rm.resources.values() for pid in r.allocated_to}
+    for pid in holders | set(rm._held_by_pid):
+        expected = sorted(rid for rid, r in rm.resources.items() if pid in r.allocated_to)
+        assert rm.get_held_resources(pid) == expected, pid
+
+
+def test_held_index_tracks_requests_and_releases():
+    """request/release/release_all keep the holdings index exact."""
+    rm = ResourceManager.empty()
+    for rid in range(1, 4):
+        rm.add_resource(Resource(rid, f"R{rid}", ResourceType.DISK, 2))
+    
+    rm.request(1, 1, 2)
+    rm.request(1, 2)
+    rm.request(2, 2)
+    rm.request(2, 3)
+    rm.request(3, 1)  # Waits: R1 fully allocated to P1
+    _assert_held_index_matches(rm)
+    
+    rm.release(1, 1, 1)
+    _assert_held_index_matches(rm)
+    rm.release(1, 1)
+    _assert_held_index_matches(rm)
+    
+    assert rm.release_all(2) == {2: 1, 3: 1}
+    _assert_held_index_matches(rm)
+
+
+def test_held_index_after_deadlock_resolution():
+    """Preempting and terminating victims leaves the index consistent."""
+    for method in (ResolutionMethod.RESOURCE_PREEMPTION,
+                   ResolutionMethod.PROCESS_TERMINATION):
+        rm = ResourceManager.empty()
+        rag = ResourceAllocationGraph()
+        for rid in (1, 2, 3):
+            rm.add_resource(Resource(rid, f"R{rid}", ResourceType.DISK, 1))
+            rag.add_resource(rid)
+        for pid, held, wanted in ((1, 1, 2), (2, 2, 3), (3, 3, 1)):
+            assert rm.request(pid, held)
+            rag.add_assignment_edge(held, pid)
+        for pid, held, wanted in ((1, 1, 2), (2, 2, 3), (3, 3, 1)):
+            assert not rm.request(pid, wanted)
+            rag.add_request_edge(pid, wanted)
+        
+        resolver = DeadlockResolver(rm, rag, DeadlockDetector(rag))
+        assert resolver.resolve_all(method)
+        _assert_held_index_matches(rm)
+
+
+def test_release_all_finds_direct_allocations():
+    """Allocations made on the Resource itself are still released."""
+    rm = ResourceManager.empty()
+    rm.add_resource(Resource(1, "R1", ResourceType.DISK, 2))
+    rm.add_resource(Resource(2, "R2", ResourceType.DISK, 1))
+    rm.resources[1].allocate(7, 2)
+    rm.resources[2].allocate(7)
+    
+    assert rm.release_all(7) == {1: 2, 2: 1}
+    assert rm.resources[1].available_instances == 2
+    assert rm.resources[2].available_instances == 1
+
+
+def test_allocation_history_wraps_past_capacity():
+    """Only the newest HISTORY_CAPACITY events are kept, oldest first."""
+    rm = ResourceManager.empty()
+    rm.HISTORY_CAPACITY = 4
+    rm.add_resource(Resource(1, "R1", ResourceType.DISK, 1))
+    for time in range(6):
+        rm.set_time(time)
+        rm.request(time, 1)  # Allocated at t=0, denied afterwards
+    
+    history = rm.allocation_history
+    assert len(history) == 4
+    assert [e.timestamp for e in history] == [2, 3, 4, 5]
+    assert [e.process_id for e in history[-2:]] == [4, 5]
+    assert history[0].event_type == 'request'
+    assert rm.get_history() == list(history)
+    
+    rm.set_time(6)
+    rm.release(0, 1)
+    assert [e.timestamp for e in rm.get_history()] == [3, 4, 5, 6]
+    assert rm.allocation_history[-1].event_type == 'release'
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""Tests for the CPU scheduling algorithms."""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+from models.process import Process
+from scheduling.base_scheduler import HeapScheduler
+from scheduling.fcfs_scheduler import FCFSScheduler
+from scheduling.priority_scheduler import PreemptivePriorityScheduler, PriorityScheduler
+from scheduling.sjf_scheduler import SJFScheduler
+from scheduling.round_robin_scheduler import RoundRobinScheduler
+
+
+def _process(pid: int, burst: int, priority: int = 0, arrival: int = 0) -> Process:
+    return Process(pid=pid, name=f"P{pid}", burst_time=burst,
+                   priority=priority, arrival_time=arrival)
+
+
+def test_round_robin_select_next_follows_ready_queue():
+    """select_next reports the front of the ready queue, which schedule() drains."""
+    scheduler = RoundRobinScheduler(time_quantum=10)
+    first, second = _process(1, 30), _process(2, 5)
+    assert scheduler.select_next() is None
+    
+    scheduler.add_to_ready_queue(first)
+    scheduler.add_to_ready_queue(second)
+    assert scheduler.select_next() is first
+    scheduler.remove_from_ready_queue(first)
+    assert scheduler.select_next() is second
+    
+    result = scheduler.schedule([first, second])
+    assert result.gantt_chart == [(1, 0, 10), (2, 10, 15), (1, 15, 25), (1, 25, 35)]
+    assert scheduler.select_next() is None
+
+
+def test_fcfs_select_next_follows_ready_queue():
+    """select_next reports the oldest queued process; schedule() leaves none."""
+    scheduler = FCFSScheduler()
+    late, early = _process(1, 10, arrival=5), _process(2, 10)
+    scheduler.add_to_ready_queue(late)
+    scheduler.add_to_ready_queue(early)
+    assert scheduler.select_next() is late
+    
+    result = scheduler.schedule([late, early])
+    assert result.gantt_chart == [(2, 0, 10), (1, 10, 20)]
+    assert scheduler.select_next() is None
+
+
+class _PriorityOnlyScheduler(HeapScheduler):
+    """Heap scheduler keyed on priority alone, to expose insertion order."""
+    
+    @staticmethod
+    def _ready_key(process):
+        return (process.priority,)
+    
+    def schedule(self, processes):
+        raise NotImplementedError
+
+
+def test_heap_scheduler_keeps_insertion_order_for_equal_keys():
+    """Equal heap keys come out in the order they were queued."""
+    scheduler = _PriorityOnlyScheduler("test")
+    queued = [_process(pid, 10, priority=1) for pid in (5, 2, 9, 1)]
+    for process in queued:
+        scheduler.add_to_ready_queue(process)
+    scheduler.add_to_ready_queue(_process(7, 10, priority=3))
+    
+    picked = []
+    while scheduler.select_next() is not None:
+        process = scheduler.select_next()
+        picked.append(process.pid)
+        scheduler.remove_from_ready_queue(process)
+    assert picked == [5, 2, 9, 1, 7]
+
+
+def test_heap_scheduler_requires_ready_key():
+    """A heap scheduler without a ready key cannot be instantiated."""
+    class Keyless(HeapScheduler):
+        def schedule(self, processes):
+            raise NotImplementedError
+    
+    with pytest.raises(TypeError):
+        Keyless("keyless")
+
+
+def test_heap_schedulers_break_ties_by_arrival_then_pid():
+    """Equal priorities and bursts run in (arrival, pid) order."""
+    rows = [(4, 2, 5), (2, 2, 5), (3, 2, 0), (1, 1, 20), (5, 2, 0)]
+    processes = [_process(pid, 10, priority=prio, arrival=arrival)
+                 for pid, prio, arrival in rows]
+    result = PriorityScheduler().schedule(processes)
+    assert [pid for pid, _, _ in result.gantt_chart] == [3, 5, 1, 2, 4]
+    
+    processes = [_process(pid, 5 if pid == 1 else 10, arrival=arrival)
+                 for pid, _, arrival in rows]
+    result = SJFScheduler().schedule(processes)
+    assert result.gantt_chart == [(3, 0, 10), (5, 10, 20), (1, 20, 25),
+                                  (2, 25, 35), (4, 35, 45)]
+
+
+def test_priority_aging_lets_waiting_process_overtake():
+    """A long-waiting low-priority process ages past a later arrival."""
+    def workload():
+        return [_process(2, 400, priority=2), _process(1, 30, priority=6),
+                _process(3, 30, priority=4, arrival=300)]
+    
+    result = PreemptivePriorityScheduler(aging_interval=50).schedule(workload())
+    assert [g for g in result.gantt_chart if g[0] != 2] == [
+        (1, 400, 430), (3, 430, 450), (3, 450, 460)]
+    assert sorted((p.pid, p.aging_counter) for p in result.processes) == [
+        (1, 8), (2, 7), (3, 4)]
+    
+    # Without aging the later, higher-priority arrival runs first
+    result = PreemptivePriorityScheduler(aging_interval=10**6).schedule(workload())
+    assert [g for g in result.gantt_chart if g[0] != 2] == [(3, 400, 430), (1, 430, 460)]